@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 from pathlib import Path
 from typing import Union
 
+try:  # Optional: parses JSON ~2-3x faster than the stdlib when installed.
+    import orjson as _fast_json
+except ImportError:  # pragma: no cover - depends on environment
+    _fast_json = None
+
 DEFAULT_CONFIG_PATH = Path("config_rules/config.json")
 
+# Parsed configuration files keyed by (absolute path, mtime in ns). Editing
+# a config file changes its mtime and therefore invalidates the entry.
+_CONFIG_CACHE: dict[tuple[str, int], dict] = {}
+
 
 def load_config(
     config_path: Union[str, os.PathLike[str], Path] = DEFAULT_CONFIG_PATH,
@@ -47,10 +57,26 @@ def load_config(
                 f"Configuration file not found: {config_path}"
             )
 
+    # Serve repeated loads of an unchanged file from the cache. Callers
+    # mutate the returned dict (main() injects bookkeeping keys), so each
+    # hit returns a deep copy rather than the cached object itself.
+    try:
+        stat = config_path.stat()
+        cache_key = (str(config_path.resolve()), stat.st_mtime_ns)
+    except OSError:
+        cache_key = None
+    if cache_key is not None and cache_key in _CONFIG_CACHE:
+        return copy.deepcopy(_CONFIG_CACHE[cache_key])
+
     try:
-        with config_path.open("r", encoding="utf-8") as f:
-            config = json.load(f)
-    except json.JSONDecodeError as e:
+        if _fast_json is not None:
+            config = _fast_json.loads(config_path.read_bytes())
+        else:
+            with config_path.open("r", encoding="utf-8") as f:
+                config = json.load(f)
+    # orjson.JSONDecodeError and json.JSONDecodeError both subclass
+    # ValueError, so one clause covers either parser.
+    except ValueError as e:
         raise ValueError(
             f"Error decoding JSON from config file {config_path}: {e}"
         )
@@ -68,4 +94,7 @@ def load_config(
             f" {type(config)} from {config_path}"
         )
 
+    if cache_key is not None:
+        _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
+
     return config
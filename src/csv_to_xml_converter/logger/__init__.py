@@ -13,6 +13,10 @@ DEFAULT_LOG_FORMAT = (
     "%(module)s:%(lineno)d - %(message)s"
 )
 
+# Formatter objects are stateless, so one shared instance serves every
+# handler instead of being rebuilt on each setup_logger call.
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT)
+
 
 def setup_logger(
     config: dict | None = None,
@@ -56,9 +60,23 @@ def setup_logger(
 
     logger.setLevel(log_level)
 
+    reused_file_handler = None
     if logger.hasHandlers():
         if force_reconfigure:
+            target_base = (
+                os.path.abspath(log_file_path) if log_file_path else None
+            )
             for handler in logger.handlers[:]:
+                if (
+                    enable_file
+                    and reused_file_handler is None
+                    and isinstance(handler, RotatingFileHandler)
+                    and getattr(handler, "baseFilename", None) == target_base
+                ):
+                    # Same target file: keep the already-open handler
+                    # instead of closing and reopening it.
+                    reused_file_handler = handler
+                    continue
                 if hasattr(handler, "close"):
                     try:
                         handler.close()
@@ -79,15 +97,16 @@ def setup_logger(
         )
         log_file_path = os.path.basename(log_file_path) or "app.log"
 
-    formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_DEFAULT_FORMATTER)
         console_handler.setLevel(log_level)
         logger.addHandler(console_handler)
 
-    if enable_file and log_file_path:
+    if reused_file_handler is not None:
+        reused_file_handler.setLevel(log_level)
+        file_handler = reused_file_handler
+    elif enable_file and log_file_path:
         try:
             file_handler = RotatingFileHandler(
                 log_file_path,
@@ -95,7 +114,7 @@ def setup_logger(
                 backupCount=3,
                 encoding="utf-8",
             )
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_DEFAULT_FORMATTER)
             file_handler.setLevel(log_level)
             logger.addHandler(file_handler)
         except (OSError, IOError) as e:
@@ -104,12 +123,15 @@ def setup_logger(
                 f"{log_file_path}: {e}\n"
             )
             logger.error(
-                f"Failed to initialize file logger at {log_file_path}",
+                "Failed to initialize file logger at %s",
+                log_file_path,
                 exc_info=False,
             )
 
     logger.info(
-        f"Logger '{logger_name}' initialized. Level: {log_level_str}. "
-        f"Log file: {log_file_path if 'file_handler' in locals() else 'N/A'}"
+        "Logger '%s' initialized. Level: %s. Log file: %s",
+        logger_name,
+        log_level_str,
+        log_file_path if 'file_handler' in locals() else 'N/A',
     )
     return logger
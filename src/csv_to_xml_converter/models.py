@@ -1,4 +1,12 @@
 # src/csv_to_xml_converter/models.py
+#
+# The helper element classes (II_Element, CD_Element, MO_Element_Data,
+# ObservationDataItem, ObservationGroup) use slots=True: several are created
+# per record, only their declared fields are ever assigned, and dropping the
+# per-instance __dict__ shrinks them and speeds attribute access. The record
+# classes deliberately keep __dict__ — rule files attach output fields that
+# are not declared on the model (e.g. documentIdRootOid, item_height_code)
+# and the settlement to_xml_dict() methods read them back via vars(self).
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
@@ -9,7 +17,7 @@ class IntermediateRecord:
     raw_input_data: Optional[Dict[str, Any]] = field(default=None, repr=False)
     errors: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class II_Element: # Helper for Instance Identifier (II)
     root: Optional[str] = None
     extension: Optional[str] = None
@@ -22,7 +30,7 @@ class II_Element: # Helper for Instance Identifier (II)
             data["extension"] = self.extension
         return data
 
-@dataclass
+@dataclass(slots=True)
 class CD_Element: # Helper for Coded Value (CD)
     code: Optional[str] = None
     code_system: Optional[str] = None
@@ -41,7 +49,7 @@ class CD_Element: # Helper for Coded Value (CD)
             data["display_name"] = self.display_name
         return data
 
-@dataclass
+@dataclass(slots=True)
 class MO_Element_Data: # Helper for Monetary (MO) elements with currency
     value: Optional[str] = None
     currency: str = "JPY"
@@ -153,7 +161,7 @@ class CDAHeaderData(IntermediateRecord): # Inherits from IntermediateRecord
 
         return {k: v for k, v in data.items() if v is not None} # Remove None values
 
-@dataclass
+@dataclass(slots=True)
 class ObservationDataItem:
     # Code for the observation item itself
     item_code: Optional[CD_Element] = None
@@ -205,7 +213,7 @@ class ObservationDataItem:
 
         return {k: v for k, v in data.items() if v is not None}
 
-@dataclass
+@dataclass(slots=True)
 class ObservationGroup:
     # Code for the panel or group itself
     panel_code: Optional[CD_Element] = None
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
@@ -31,6 +32,10 @@ class Orchestrator(ArchiveVerificationMixin):
         self.config = config
         self.csv_profiles = config.get("csv_profiles", {})
         self.lookup_tables = config.get("lookup_tables", {}).copy()
+        # The parsed-records sidecar is keyed by CSV stem, and the per-CSV
+        # stages run concurrently; this guard keeps it written exactly once.
+        self._json_sidecar_lock = threading.Lock()
+        self._json_sidecars_written = set()
 
         oid_catalog_path_from_config = config.get("oid_catalog_file")
         if oid_catalog_path_from_config:
@@ -41,15 +46,15 @@ class Orchestrator(ArchiveVerificationMixin):
                         oid_data = json.load(f_oid)
                     self.lookup_tables["$oid_catalog$"] = oid_data
                     logger.info(
-                        f"Successfully loaded OID Catalog from '{resolved_oid_path}' into lookup_tables."
+                        "Successfully loaded OID Catalog from '%s' into lookup_tables.", resolved_oid_path
                     )
                 except Exception as e_oid_load:  # pragma: no cover - defensive
                     logger.error(
-                        f"Failed to load or parse OID Catalog from '{resolved_oid_path}': {e_oid_load}"
+                        "Failed to load or parse OID Catalog from '%s': %s", resolved_oid_path, e_oid_load
                     )
             else:
                 logger.warning(
-                    f"OID Catalog file specified in config ('{oid_catalog_path_from_config}') but not found at path '{resolved_oid_path}' (expected relative to project root)."
+                    "OID Catalog file specified in config ('%s') but not found at path '%s' (expected relative to project root).", oid_catalog_path_from_config, resolved_oid_path
                 )
         else:
             logger.info(
@@ -57,3 +62,27 @@ class Orchestrator(ArchiveVerificationMixin):
             )
 
         logger.info("Orchestrator initialized (CSV profiles and OID catalog processing attempted).")
+
+    def prewarm(self, rules_files=(), xsd_files=()) -> None:
+        """Populate the rule and schema-tree caches before the first CSV.
+
+        Rule JSON loads into a process-global cache, and XSDs are parsed
+        into the validator's shared tree cache so the validation worker
+        threads skip the disk read and parse. Schema *compilation* is per
+        thread and is deliberately not done here — compiling on the main
+        thread would be unreachable from the workers. Missing files are
+        logged and skipped so prewarming can never fail a run.
+        """
+        from ..rule_engine import load_rules
+        from ..validator import prewarm_schema
+
+        for rules_file in rules_files:
+            try:
+                load_rules(str(rules_file))
+            except Exception as e:
+                logger.warning("Prewarm skipped rules file %s: %s", rules_file, e)
+        for xsd_file in xsd_files:
+            try:
+                prewarm_schema(str(xsd_file))
+            except Exception as e:
+                logger.warning("Prewarm skipped XSD %s: %s", xsd_file, e)
@@ -1,23 +1,37 @@
 import logging
-import os
 import shutil
 import tempfile
 import zipfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from .xml_aggregation import XMLAggregationMixin
 
 logger = logging.getLogger(__name__)
 
+# Compression methods selectable via the "archive" config section. Zstandard
+# is only offered when the running stdlib supports it (Python 3.14+); older
+# runtimes silently keep DEFLATE so archives stay readable everywhere.
+ARCHIVE_COMPRESSION_METHODS = {
+    "deflate": zipfile.ZIP_DEFLATED,
+    "stored": zipfile.ZIP_STORED,
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):  # pragma: no cover - depends on runtime
+    ARCHIVE_COMPRESSION_METHODS["zstd"] = zipfile.ZIP_ZSTANDARD
+
 
 @dataclass
 class XMLValidationTarget:
-    """Represents an XML file to validate against an XSD."""
+    """Represents an XML file to validate against an XSD.
+
+    ``path`` may be a filesystem ``pathlib.Path`` or a ``zipfile.Path``
+    pointing inside an open archive; both support the ``name``/``read_text``
+    interface the validation code relies on.
+    """
 
-    path: Path
+    path: Any
     xsd_name: str
     file_type: str
 
@@ -25,42 +39,77 @@ class XMLValidationTarget:
 class ArchiveVerificationMixin(XMLAggregationMixin):
     """Utility methods for creating and validating submission archives."""
 
-    def _copy_xsds_for_archive(
+    def _collect_xsds_for_archive(
         self,
         xsd_source_paths: List[Path],
-        xsd_dir: Path,
-        coreschema_dir: Path,
-    ) -> None:
-        """Copy XSD files and coreschemas from configured paths into the archive."""
+    ) -> List[Tuple[Path, str]]:
+        """Return (source file, root-relative arcname) pairs for XSD files.
+
+        The directory scan is cached per source-path set on the instance so
+        repeated archive builds (or a manifest prepared while XML generation
+        is still running) do not rescan the schema directories.
+        """
+        cache_key = tuple(str(p) for p in xsd_source_paths)
+        cache = getattr(self, "_xsd_member_cache", None)
+        if cache is None:
+            cache = self._xsd_member_cache = {}
+        if cache_key in cache:
+            return cache[cache_key]
+
+        members: List[Tuple[Path, str]] = []
         for xsd_src_path in xsd_source_paths:
-            logger.info(f"Processing XSD source path for archive: {xsd_src_path}")
+            logger.info("Processing XSD source path for archive: %s", xsd_src_path)
             if xsd_src_path.exists() and xsd_src_path.is_dir():
                 for item in xsd_src_path.iterdir():
                     if item.is_file() and item.name.lower().endswith(".xsd"):
-                        target_file = xsd_dir / item.name
-                        shutil.copy2(item, target_file)
-                        logger.debug(f"Copied XSD: {item} to {target_file}")
+                        members.append((item, f"XSD/{item.name}"))
+                        logger.debug("Queued XSD for archive: %s", item)
 
                 core_schemas_dir = xsd_src_path / "coreschemas"
                 if core_schemas_dir.exists() and core_schemas_dir.is_dir():
                     for core_item in core_schemas_dir.iterdir():
                         if core_item.is_file() and core_item.name.lower().endswith(".xsd"):
-                            target_core_file = coreschema_dir / core_item.name
-                            shutil.copy2(core_item, target_core_file)
-                            logger.debug(
-                                f"Copied core schema XSD: {core_item} to {target_core_file}"
+                            members.append(
+                                (core_item, f"XSD/coreschemas/{core_item.name}")
                             )
+                            logger.debug("Queued core schema XSD for archive: %s", core_item)
             else:
                 logger.warning(
-                    f"XSD source directory {xsd_src_path} not found or not a directory. Skipping."
+                    "XSD source directory %s not found or not a directory. Skipping.", xsd_src_path
                 )
 
-        main_xsds = list(xsd_dir.glob("*.xsd"))
-        core_xsds = list(coreschema_dir.glob("*.xsd"))
-        if not main_xsds and not core_xsds:
+        if not members:
+            logger.warning(
+                "No XSD files or coreschemas were collected for the archive from configured paths: %s", xsd_source_paths
+            )
+        cache[cache_key] = members
+        return members
+
+    def _archive_compression(self) -> int:
+        """Return the zipfile compression method selected in the config."""
+        name = str(self.config.get("archive", {}).get("compression", "deflate")).lower()
+        method = ARCHIVE_COMPRESSION_METHODS.get(name)
+        if method is None:
+            logger.warning(
+                "Archive compression '%s' is unknown or unavailable in this runtime; falling back to DEFLATE.", name
+            )
+            return zipfile.ZIP_DEFLATED
+        return method
+
+    def _archive_compresslevel(self) -> int:
+        """Return the DEFLATE level selected in the config.
+
+        Defaults to 1: for XML payloads the lowest level captures most of
+        the ratio at a fraction of the CPU cost of zlib's default.
+        """
+        level = self.config.get("archive", {}).get("compresslevel", 1)
+        try:
+            return int(level)
+        except (TypeError, ValueError):
             logger.warning(
-                f"No XSD files or coreschemas were copied to the archive from configured paths: {xsd_source_paths}"
+                "Archive compresslevel %r is not an integer; falling back to 1.", level
             )
+            return 1
 
     def create_submission_archive(
         self,
@@ -72,7 +121,7 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
         archive_output_dir: str,
     ) -> Optional[str]:
         """Bundle generated XML files and XSDs into a ZIP archive."""
-        logger.info(f"Creating archive: {archive_base_name}.zip in {archive_output_dir}")
+        logger.info("Creating archive: %s.zip in %s", archive_base_name, archive_output_dir)
 
         xsd_source_paths_config = self.config.get("paths", {}).get("xsd_source_path_for_archive")
         xsd_source_paths: List[Path] = []
@@ -89,70 +138,81 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
 
         final_zip = Path(archive_output_dir) / f"{archive_base_name}.zip"
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                tmp_root = Path(temp_dir) / archive_base_name
-                d_dir = tmp_root / "DATA"
-                d_dir.mkdir(parents=True, exist_ok=True)
-                c_dir = tmp_root / "CLAIMS"
-                c_dir.mkdir(parents=True, exist_ok=True)
-                x_dir = tmp_root / "XSD"
-                x_dir.mkdir(parents=True, exist_ok=True)
-                xc_dir = x_dir / "coreschemas"
-                xc_dir.mkdir(parents=True, exist_ok=True)
-
-                if index_xml_path and Path(index_xml_path).exists():
-                    shutil.copy2(index_xml_path, tmp_root / "index.xml")
+            members: List[Tuple[Path, str]] = []
+            if index_xml_path and Path(index_xml_path).exists():
+                members.append((Path(index_xml_path), f"{archive_base_name}/index.xml"))
+            else:
+                logger.warning("Index XML %s not found for archive.", index_xml_path)
+            if summary_xml_path and Path(summary_xml_path).exists():
+                members.append((Path(summary_xml_path), f"{archive_base_name}/summary.xml"))
+            else:
+                logger.warning("Summary XML %s not found for archive.", summary_xml_path)
+
+            for p_str in data_xml_files:
+                fp = Path(p_str)
+                if fp.exists():
+                    members.append((fp, f"{archive_base_name}/DATA/{fp.name}"))
                 else:
-                    logger.warning(f"Index XML {index_xml_path} not found for archive.")
-                if summary_xml_path and Path(summary_xml_path).exists():
-                    shutil.copy2(summary_xml_path, tmp_root / "summary.xml")
+                    logger.warning("Data file %s not found.", fp)
+            for p_str in claims_xml_files:
+                fp = Path(p_str)
+                if fp.exists():
+                    members.append((fp, f"{archive_base_name}/CLAIMS/{fp.name}"))
                 else:
-                    logger.warning(f"Summary XML {summary_xml_path} not found for archive.")
+                    logger.warning("Claim file %s not found.", fp)
 
-                for p_str in data_xml_files:
-                    fp = Path(p_str)
-                    if fp.exists():
-                        shutil.copy2(fp, d_dir / fp.name)
-                    else:
-                        logger.warning(f"Data file {fp} not found.")
-                for p_str in claims_xml_files:
-                    fp = Path(p_str)
-                    if fp.exists():
-                        shutil.copy2(fp, c_dir / fp.name)
-                    else:
-                        logger.warning(f"Claim file {fp} not found.")
-
-                self._copy_xsds_for_archive(xsd_source_paths, x_dir, xc_dir)
-
-                final_zip.parent.mkdir(parents=True, exist_ok=True)
-                with zipfile.ZipFile(final_zip, "w", zipfile.ZIP_DEFLATED) as zf:
-                    for r_path_obj_walk_root, _, files_in_walk_dir in os.walk(tmp_root):
-                        for file_in_walk_dir in files_in_walk_dir:
-                            file_abs_path = Path(r_path_obj_walk_root) / file_in_walk_dir
-                            arcname = file_abs_path.relative_to(tmp_root.parent)
-                            zf.write(file_abs_path, arcname=arcname)
-                    standard_dirs_to_ensure_in_zip = [d_dir, c_dir, x_dir, xc_dir]
-                    for std_dir_path in standard_dirs_to_ensure_in_zip:
-                        if std_dir_path.is_dir():
-                            arc_dir_name = (
-                                str(std_dir_path.relative_to(tmp_root.parent)).replace(os.sep, "/") + "/"
-                            )
-                            try:
-                                zf.getinfo(arc_dir_name)
-                            except KeyError:
-                                dir_zipinfo = zipfile.ZipInfo(
-                                    arc_dir_name, date_time=datetime.now().timetuple()[:6]
-                                )
-                                dir_zipinfo.external_attr = 0o40755 << 16
-                                zf.writestr(dir_zipinfo, "")
-                logger.info("Archive created: %s", final_zip)
-                return str(final_zip)
+            members.extend(
+                (src, f"{archive_base_name}/{rel_name}")
+                for src, rel_name in self._collect_xsds_for_archive(xsd_source_paths)
+            )
+
+            final_zip.parent.mkdir(parents=True, exist_ok=True)
+            dir_date_time = datetime.now().timetuple()[:6]
+            standard_dirs = ("DATA", "CLAIMS", "XSD", "XSD/coreschemas")
+            with zipfile.ZipFile(
+                final_zip,
+                "w",
+                self._archive_compression(),
+                compresslevel=self._archive_compresslevel(),
+            ) as zf:
+                for std_dir in standard_dirs:
+                    dir_zipinfo = zipfile.ZipInfo(
+                        f"{archive_base_name}/{std_dir}/", date_time=dir_date_time
+                    )
+                    dir_zipinfo.external_attr = 0o40755 << 16
+                    zf.writestr(dir_zipinfo, "")
+                for src_path, arcname in members:
+                    # Stream each member through the compressor in 1 MiB
+                    # chunks instead of reading the whole file into memory
+                    # as writestr/write would. One stat call pre-sizes the
+                    # ZipInfo (size and timestamp) so zipfile does not have
+                    # to discover either while writing.
+                    member_stat = src_path.stat()
+                    member_info = zipfile.ZipInfo(
+                        arcname,
+                        date_time=datetime.fromtimestamp(
+                            member_stat.st_mtime
+                        ).timetuple()[:6],
+                    )
+                    member_info.file_size = member_stat.st_size
+                    member_info.compress_type = zf.compression
+                    member_info._compresslevel = zf.compresslevel
+                    member_info.external_attr = 0o600 << 16
+                    with src_path.open("rb") as src_f, zf.open(member_info, "w") as dst:
+                        shutil.copyfileobj(src_f, dst, length=1 << 20)
+            logger.info("Archive created: %s", final_zip)
+            return str(final_zip)
         except Exception as e:  # pragma: no cover - defensive
             logger.error("Error creating archive: %s", e, exc_info=True)
             return None
 
-    def _collect_xml_validation_targets(self, archive_root: Path) -> Tuple[List[XMLValidationTarget], bool]:
-        """Return a list of XML files with their expected XSDs and a success flag."""
+    def _collect_xml_validation_targets(self, archive_root: Any) -> Tuple[List[XMLValidationTarget], bool]:
+        """Return a list of XML files with their expected XSDs and a success flag.
+
+        ``archive_root`` may be a filesystem directory or a ``zipfile.Path``
+        rooted inside an open archive; only the common traversal interface
+        (``/``, ``exists``, ``is_dir``, ``iterdir``) is used.
+        """
         targets: List[XMLValidationTarget] = []
         all_found = True
 
@@ -160,14 +220,14 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
         if index_xml.exists():
             targets.append(XMLValidationTarget(index_xml, "ix08_V08.xsd", "Index"))
         else:
-            logger.error(f"index.xml not found in archive at expected location: {index_xml}")
+            logger.error("index.xml not found in archive at expected location: %s", index_xml)
             all_found = False
 
         summary_xml = archive_root / "summary.xml"
         if summary_xml.exists():
             targets.append(XMLValidationTarget(summary_xml, "su08_V08.xsd", "Summary"))
         else:
-            logger.error(f"summary.xml not found in archive at expected location: {summary_xml}")
+            logger.error("summary.xml not found in archive at expected location: %s", summary_xml)
             all_found = False
 
         data_dir = archive_root / "DATA"
@@ -179,7 +239,7 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
                     elif item.name.startswith("hg_cda_"):
                         targets.append(XMLValidationTarget(item, "hg08_V08.xsd", "Health Guidance CDA"))
                     else:
-                        logger.warning(f"Could not determine XSD for DATA file: {item.name}")
+                        logger.warning("Could not determine XSD for DATA file: %s", item.name)
 
         claims_dir = archive_root / "CLAIMS"
         if claims_dir.is_dir():
@@ -190,7 +250,7 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
                     elif item.name.startswith("gs_"):
                         targets.append(XMLValidationTarget(item, "gc08_V08.xsd", "Guidance Settlement"))
                     else:
-                        logger.warning(f"Could not determine XSD for CLAIMS file: {item.name}")
+                        logger.warning("Could not determine XSD for CLAIMS file: %s", item.name)
 
         return targets, all_found
 
@@ -199,79 +259,95 @@ class ArchiveVerificationMixin(XMLAggregationMixin):
         xsd_path = xsd_dir / target.xsd_name
         if not xsd_path.exists():
             logger.error(
-                f"XSD file '{target.xsd_name}' not found in archive's XSD directory ({xsd_dir}) for {target.file_type} '{target.path.name}'. Skipping validation."
+                "XSD file '%s' not found in archive's XSD directory (%s) for %s '%s'. Skipping validation.", target.xsd_name, xsd_dir, target.file_type, target.path.name
             )
             return False
         try:
             logger.info(
-                f"Validating {target.file_type}: {target.path.name} against {xsd_path.name}"
+                "Validating %s: %s against %s", target.file_type, target.path.name, xsd_path.name
             )
             xml_content = target.path.read_text(encoding="utf-8")
             is_valid, errors = self._validate_xml(xml_content, str(xsd_path))
             if is_valid:
                 logger.info(
-                    f"OK: {target.file_type} '{target.path.name}' is valid against '{xsd_path.name}'."
+                    "OK: %s '%s' is valid against '%s'.", target.file_type, target.path.name, xsd_path.name
                 )
                 return True
             logger.error(
-                f"FAIL: {target.file_type} '{target.path.name}' is invalid against '{xsd_path.name}'. Errors: {errors}"
+                "FAIL: %s '%s' is invalid against '%s'. Errors: %s", target.file_type, target.path.name, xsd_path.name, errors
             )
             return False
         except Exception as exc:  # pragma: no cover - defensive
             logger.error(
-                f"Error validating {target.file_type} '{target.path.name}': {exc}", exc_info=True
+                "Error validating %s '%s': %s", target.file_type, target.path.name, exc, exc_info=True
             )
             return False
 
     def verify_archive_contents(self, zip_archive_path: str) -> bool:
         """Validate XML files in a created archive against their bundled XSDs."""
-        logger.info(f"Verifying contents of archive: {zip_archive_path}")
+        logger.info("Verifying contents of archive: %s", zip_archive_path)
         temp_dir_obj = tempfile.TemporaryDirectory(prefix="zip_verify_")
         temp_dir_path = Path(temp_dir_obj.name)
         all_valid = True
 
         try:
-            logger.debug(f"Extracting archive to temporary directory: {temp_dir_path}")
+            archive_stem = Path(zip_archive_path).stem
             with zipfile.ZipFile(zip_archive_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir_path)
-
-            archive_root = temp_dir_path / Path(zip_archive_path).stem
-            xsd_dir = archive_root / "XSD"
-
-            targets, found_required = self._collect_xml_validation_targets(archive_root)
-            if not targets and found_required:
-                logger.warning(
-                    f"No XML files were found or mapped for validation in archive {zip_archive_path}."
+                # Only the XSDs are extracted: lxml resolves their includes
+                # through the filesystem. The XML members are read straight
+                # out of the archive via zipfile.Path, so the bulk of the
+                # payload is never written to disk a second time.
+                xsd_prefix = f"{archive_stem}/XSD/"
+                xsd_members = [
+                    name
+                    for name in zip_ref.namelist()
+                    if name.startswith(xsd_prefix) and not name.endswith("/")
+                ]
+                logger.debug(
+                    "Extracting %d XSD members to temporary directory: %s",
+                    len(xsd_members),
+                    temp_dir_path,
                 )
-            if not found_required:
-                all_valid = False
+                zip_ref.extractall(temp_dir_path, members=xsd_members)
 
-            for target in targets:
-                if not self._validate_xml_file(target, xsd_dir):
+                archive_root = zipfile.Path(zip_ref, at=f"{archive_stem}/")
+                xsd_dir = temp_dir_path / archive_stem / "XSD"
+
+                targets, found_required = self._collect_xml_validation_targets(archive_root)
+                if not targets and found_required:
+                    logger.warning(
+                        "No XML files were found or mapped for validation in archive %s.", zip_archive_path
+                    )
+                if not found_required:
                     all_valid = False
 
+                for target in targets:
+                    if not self._validate_xml_file(target, xsd_dir):
+                        all_valid = False
+
         except FileNotFoundError:
-            logger.error(f"Archive not found: {zip_archive_path}")
+            logger.error("Archive not found: %s", zip_archive_path)
             all_valid = False
         except zipfile.BadZipFile:
-            logger.error(f"Invalid or corrupted ZIP file: {zip_archive_path}")
+            logger.error("Invalid or corrupted ZIP file: %s", zip_archive_path)
             all_valid = False
         except Exception as e:  # pragma: no cover - defensive
             logger.error(
-                f"An unexpected error occurred during archive verification: {e}",
+                "An unexpected error occurred during archive verification: %s",
+                e,
                 exc_info=True,
             )
             all_valid = False
         finally:
-            logger.debug(f"Cleaning up temporary directory: {temp_dir_path}")
+            logger.debug("Cleaning up temporary directory: %s", temp_dir_path)
             temp_dir_obj.cleanup()
 
         if all_valid:
             logger.info(
-                f"All XML files in archive '{zip_archive_path}' successfully validated against their XSDs from within the archive."
+                "All XML files in archive '%s' successfully validated against their XSDs from within the archive.", zip_archive_path
             )
         else:
             logger.error(
-                f"One or more XML files in archive '{zip_archive_path}' failed validation or were missing."
+                "One or more XML files in archive '%s' failed validation or were missing.", zip_archive_path
             )
         return all_valid
@@ -1,5 +1,6 @@
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -24,6 +25,36 @@ class CSVProcessingMixin:
     csv_profiles: Dict[str, Any]
     lookup_tables: Dict[str, Any]
 
+    def _write_parsed_records_json(
+        self, csv_file_path: str, parsed_data_rows: List[Dict[str, Any]]
+    ) -> None:
+        """Write the parsed-records JSON sidecar for a CSV, at most once.
+
+        The sidecar path is keyed by the CSV stem, and the per-CSV stages
+        run concurrently on a thread pool with the same parsed rows, so
+        the first stage to get here writes the file and the rest skip it;
+        the lock-guarded set keeps the open/truncate from racing.
+        """
+        json_out_dir = (
+            self.config.get("paths", {}).get("json_output_dir")
+            or self.config.get("json_output_dir")
+        )
+        if json_out_dir:
+            Path(json_out_dir).mkdir(parents=True, exist_ok=True)
+            json_path = Path(json_out_dir) / (Path(csv_file_path).stem + ".json")
+        else:
+            json_path = Path(csv_file_path).with_suffix(".json")
+        with self._json_sidecar_lock:
+            if json_path in self._json_sidecars_written:
+                return
+            self._json_sidecars_written.add(json_path)
+        try:
+            with open(json_path, "w", encoding="utf-8") as jf:
+                json.dump(parsed_data_rows, jf, ensure_ascii=False, indent=2)
+            logger.info("Wrote parsed records to %s", json_path)
+        except Exception as e_dump:
+            logger.error("Failed to write JSON output %s: %s", json_path, e_dump)
+
     def _get_csv_profile(self, profile_name: str) -> Dict[str, Any]:
         """Return CSV profile configuration for a given name."""
         default_p = {"encoding": "utf-8", "delimiter": ",", "header": True}
@@ -111,7 +142,7 @@ class CSVProcessingMixin:
     ) -> List[str]:
         """Generic CSV to XML processing helper."""
         logger.info(
-            f"Processing {model_class.__name__} records from {csv_file_path} using profile \"{csv_profile_name}\""
+            "Processing %s records from %s using profile \"%s\"", model_class.__name__, csv_file_path, csv_profile_name
         )
         successful_files: List[str] = []
         parsed_data_rows_count = 0
@@ -121,41 +152,27 @@ class CSVProcessingMixin:
             parsed_data_rows = self._load_csv_records(csv_file_path, csv_profile_name)
             parsed_data_rows_count = len(parsed_data_rows)
             if not parsed_data_rows:
-                logger.error(f"No data from {csv_file_path}")
+                logger.error("No data from %s", csv_file_path)
                 return []
 
-            json_out_dir = (
-                self.config.get("paths", {}).get("json_output_dir")
-                or self.config.get("json_output_dir")
-            )
-            if json_out_dir:
-                Path(json_out_dir).mkdir(parents=True, exist_ok=True)
-                json_path = Path(json_out_dir) / (Path(csv_file_path).stem + ".json")
-            else:
-                json_path = Path(csv_file_path).with_suffix(".json")
-            try:
-                with open(json_path, "w", encoding="utf-8") as jf:
-                    json.dump(parsed_data_rows, jf, ensure_ascii=False, indent=2)
-                logger.info(f"Wrote parsed records to {json_path}")
-            except Exception as e_dump:
-                logger.error(f"Failed to write JSON output {json_path}: {e_dump}")
+            self._write_parsed_records_json(csv_file_path, parsed_data_rows)
 
             rules = load_rules(rules_file_path)
             Path(output_xml_dir).mkdir(parents=True, exist_ok=True)
             logger.info(
-                f"Loaded {len(rules)} rules for {model_class.__name__} from: {rules_file_path}"
+                "Loaded %s rules for %s from: %s", len(rules), model_class.__name__, rules_file_path
             )
 
             for i, record_data in enumerate(parsed_data_rows):
                 row_doc_id = record_data.get("doc_id", f"unk_{short_prefix}_doc_{i+1}")
                 logger.info(
-                    f"Processing {short_prefix.upper()} record {i+1}/{parsed_data_rows_count}: {row_doc_id}"
+                    "Processing %s record %s/%s: %s", short_prefix.upper(), i+1, parsed_data_rows_count, row_doc_id
                 )
                 try:
                     model_instance = self._transform_record(record_data, rules, model_class)
                     if model_instance is None:
                         logger.warning(
-                            f"No data after rules for {short_prefix.upper()} record {row_doc_id}."
+                            "No data after rules for %s record %s.", short_prefix.upper(), row_doc_id
                         )
                         continue
 
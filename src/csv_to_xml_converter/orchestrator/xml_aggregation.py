@@ -1,4 +1,6 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -16,6 +18,20 @@ from .csv_processing import CSVProcessingMixin
 logger = logging.getLogger(__name__)
 
 
+def _claim_amount_for_file(claim_file: str) -> float:
+    """Return the claim amount of one CC08/GC08 file, or 0.0 if neither."""
+    amount_cc = get_claim_amount_from_cc08(claim_file)
+    if amount_cc is not None:
+        logger.debug("Processed CC08 %s, amount: %s", claim_file, amount_cc)
+        return amount_cc
+
+    amount_gc = get_claim_amount_from_gc08(claim_file)
+    if amount_gc is not None:
+        logger.debug("Processed GC08 %s, amount: %s", claim_file, amount_gc)
+        return amount_gc
+    return 0.0
+
+
 class XMLAggregationMixin(CSVProcessingMixin):
     """Methods for creating aggregated index and summary XML files."""
 
@@ -28,7 +44,7 @@ class XMLAggregationMixin(CSVProcessingMixin):
         rules_file_path: Optional[str] = None,
     ) -> bool:
         """Generate index.xml using aggregation and rule based transformation."""
-        logger.info(f"Generating aggregated index.xml to {output_xml_path}")
+        logger.info("Generating aggregated index.xml to %s", output_xml_path)
         try:
             total_record_count = len(data_xml_files) + len(claims_xml_files)
             creation_time = datetime.now(timezone.utc).strftime("%Y%m%d")
@@ -67,25 +83,25 @@ class XMLAggregationMixin(CSVProcessingMixin):
                 if getattr(transformed_obj, k, None) is None
             ]
             if missing_required_fields:
-                logger.error(f"Missing required fields for index.xml: {missing_required_fields}")
+                logger.error("Missing required fields for index.xml: %s", missing_required_fields)
                 return False
 
             from . import generate_index_xml  # patched in tests
             xml_string = generate_index_xml(transformed_obj)
             is_valid, errors = self._validate_xml(xml_string, xsd_file_path)
             if not is_valid:
-                logger.error(f"Aggregated index.xml FAILED validation: {errors}")
+                logger.error("Aggregated index.xml FAILED validation: %s", errors)
                 return False
 
             Path(output_xml_path).parent.mkdir(parents=True, exist_ok=True)
             with open(output_xml_path, "w", encoding="utf-8") as f:
                 f.write(xml_string)
             logger.info(
-                f"Successfully generated and validated aggregated index.xml: {output_xml_path}"
+                "Successfully generated and validated aggregated index.xml: %s", output_xml_path
             )
             return True
         except Exception as e:  # pragma: no cover - defensive
-            logger.error(f"Error generating aggregated index.xml: {e}", exc_info=True)
+            logger.error("Error generating aggregated index.xml: %s", e, exc_info=True)
             return False
 
     def generate_aggregated_summary_xml(
@@ -97,28 +113,25 @@ class XMLAggregationMixin(CSVProcessingMixin):
         rules_file_path: Optional[str] = None,
     ) -> bool:
         """Generate summary.xml from aggregated claim amounts and subject counts."""
-        logger.info(f"Generating aggregated summary.xml to {output_xml_path}")
+        logger.info("Generating aggregated summary.xml to %s", output_xml_path)
         try:
-            total_subject_count = 0
-            for cda_file in data_xml_files:
-                total_subject_count += get_subject_count_from_cda(cda_file)
-
-            total_cost_amount = 0.0
-            total_claim_amount = 0.0
-
-            for claim_file in claims_xml_files:
-                amount_cc = get_claim_amount_from_cc08(claim_file)
-                if amount_cc is not None:
-                    total_claim_amount += amount_cc
-                    total_cost_amount += amount_cc
-                    logger.debug(f"Processed CC08 {claim_file}, amount: {amount_cc}")
-                    continue
-
-                amount_gc = get_claim_amount_from_gc08(claim_file)
-                if amount_gc is not None:
-                    total_claim_amount += amount_gc
-                    total_cost_amount += amount_gc
-                    logger.debug(f"Processed GC08 {claim_file}, amount: {amount_gc}")
+            # Every file contributes an independent number, and lxml releases
+            # the GIL while parsing, so the per-file extraction spreads across
+            # a thread pool; summation stays single-threaded afterwards.
+            max_workers = min(
+                len(data_xml_files) + len(claims_xml_files) or 1,
+                os.cpu_count() or 1,
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                subject_counts = pool.map(
+                    get_subject_count_from_cda, data_xml_files
+                )
+                claim_amounts = pool.map(
+                    _claim_amount_for_file, claims_xml_files
+                )
+                total_subject_count = sum(subject_counts)
+                total_claim_amount = sum(claim_amounts)
+            total_cost_amount = total_claim_amount
 
             if not rules_file_path:
                 rules_file_path = self.config.get("rule_files", {}).get("summary_rules")
@@ -150,16 +163,16 @@ class XMLAggregationMixin(CSVProcessingMixin):
             xml_string = generate_summary_xml(transformed_obj)
             is_valid, errors = self._validate_xml(xml_string, xsd_file_path)
             if not is_valid:
-                logger.error(f"Aggregated summary.xml FAILED validation: {errors}")
+                logger.error("Aggregated summary.xml FAILED validation: %s", errors)
                 return False
 
             Path(output_xml_path).parent.mkdir(parents=True, exist_ok=True)
             with open(output_xml_path, "w", encoding="utf-8") as f:
                 f.write(xml_string)
             logger.info(
-                f"Successfully generated and validated aggregated summary.xml: {output_xml_path}"
+                "Successfully generated and validated aggregated summary.xml: %s", output_xml_path
             )
             return True
         except Exception as e:  # pragma: no cover - defensive
-            logger.error(f"Error generating aggregated summary.xml: {e}", exc_info=True)
+            logger.error("Error generating aggregated summary.xml: %s", e, exc_info=True)
             return False
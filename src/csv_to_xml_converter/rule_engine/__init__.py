@@ -4,9 +4,15 @@ Rule Engine with entry_relationship_group support.
 """
 import json, os, logging, re
 import sys  # Required for self-test logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:  # Optional: parses rule JSON ~2-3x faster than the stdlib when installed.
+    import orjson as _fast_json
+except ImportError:  # pragma: no cover - depends on environment
+    _fast_json = None
+
 logger = logging.getLogger(__name__) # Moved logger definition up
 
 __all__ = [
@@ -20,23 +26,34 @@ __all__ = [
     "calculate_bmi",
 ]
 
+@lru_cache(maxsize=4096)
+def _split_attr_path(attr_path: str) -> Tuple[str, ...]:
+    """Split a dotted attribute path, memoized.
+
+    ``_set_nested_attr`` runs once per rule per row, but the set of
+    distinct paths is just whatever the rule files mention, so caching
+    the split keeps the hot loop to a tuple lookup.
+    """
+    return tuple(attr_path.split('.'))
+
+
 def _set_nested_attr(target_obj: Any, attr_path: str, value: Any):
-    logger.debug(f"Setting nested attr: path='{attr_path}', value='{value}' on obj of type {type(target_obj)}")
-    parts = attr_path.split('.')
+    logger.debug("Setting nested attr: path='%s', value='%s' on obj of type %s", attr_path, value, type(target_obj))
+    parts = _split_attr_path(attr_path)
     obj_to_set_on = target_obj
     try:
         for i, part in enumerate(parts[:-1]):
             next_obj = getattr(obj_to_set_on, part)
             if next_obj is None:
-                logger.warning(f"Intermediate object is None at '{'.'.join(parts[:i+1])}' while trying to set '{attr_path}'. Value might not be set if parent object was None.")
+                logger.warning("Intermediate object is None at '%s' while trying to set '%s'. Value might not be set if parent object was None.", '.'.join(parts[:i+1]), attr_path)
                 return
             obj_to_set_on = next_obj
         setattr(obj_to_set_on, parts[-1], value)
-        logger.debug(f"Successfully set '{parts[-1]}' on object of type {type(obj_to_set_on)} to '{value}'")
+        logger.debug("Successfully set '%s' on object of type %s to '%s'", parts[-1], type(obj_to_set_on), value)
     except AttributeError as e:
-        logger.error(f"AttributeError while setting nested attribute '{attr_path}': {e}. Object path may be invalid or intermediate object not initialized.", exc_info=True)
+        logger.error("AttributeError while setting nested attribute '%s': %s. Object path may be invalid or intermediate object not initialized.", attr_path, e, exc_info=True)
     except Exception as e:
-        logger.error(f"Unexpected error while setting nested attribute '{attr_path}': {e}", exc_info=True)
+        logger.error("Unexpected error while setting nested attribute '%s': %s", attr_path, e, exc_info=True)
 
 # Assuming models.py is one level up
 # For self-test, ensure path allows this or use try-except
@@ -51,13 +68,13 @@ except ImportError:
 # Calculation Helper Functions
 def calculate_bmi(weight_kg: Optional[float], height_m: Optional[float]) -> Optional[float]:
     if weight_kg is None or height_m is None or height_m == 0:
-        logger.warning(f"Cannot calculate BMI with weight={weight_kg}, height={height_m}")
+        logger.warning("Cannot calculate BMI with weight=%s, height=%s", weight_kg, height_m)
         return None
     try:
         bmi = float(weight_kg) / (float(height_m) ** 2)
         return round(bmi, 2) # Round to 2 decimal places
     except (ValueError, TypeError) as e:
-        logger.error(f"Error calculating BMI (weight={weight_kg}, height={height_m}): {e}")
+        logger.error("Error calculating BMI (weight=%s, height=%s): %s", weight_kg, height_m, e)
         return None
 
 CALCULATION_FUNCTIONS = {
@@ -134,13 +151,31 @@ def to_boolean(v: Any) -> Optional[bool]:
 
     raise RuleApplicationError(f"Bool conversion error: {v}")
 
+# Parsed rule files keyed on (absolute path, mtime_ns); the same handful of
+# rule files is re-loaded for every processed CSV, so re-parsing the JSON
+# each time is pure overhead.
+_RULES_CACHE: Dict[tuple, List[Dict[str, Any]]] = {}
+
 def load_rules(p: str) -> List[Dict[str, Any]]:
-    """Load rule definitions from the given JSON file."""
+    """Load rule definitions from the given JSON file.
+
+    Results are cached per file path and modification time. Callers must
+    treat the returned list as read-only.
+    """
     try:
-        with open(p, "r", encoding="utf-8") as fp:
-            rules = json.load(fp)
+        abs_p = os.path.abspath(p)
+        cache_key = (abs_p, os.stat(abs_p).st_mtime_ns)
+        cached = _RULES_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        if _fast_json is not None:
+            rules = _fast_json.loads(Path(abs_p).read_bytes())
+        else:
+            with open(abs_p, "r", encoding="utf-8") as fp:
+                rules = json.load(fp)
         if not isinstance(rules, list):
             raise ValueError("Rules file must be a JSON list.")
+        _RULES_CACHE[cache_key] = rules
         return rules
     except Exception as exc:  # pragma: no cover - configuration errors
         logger.exception("Err load rules %s", p)
@@ -206,7 +241,7 @@ def _apply_single_rule(
     if rt == "lookup_value" and rule.get("output_mappings"):
         pass # Proceed, specific checks for output_mappings will handle assignment
     elif not of and rt not in ["conditional_mapping", "entry_relationship_group", "split"]:
-        logger.warning(f"Rule (type: {rt}) missing output_field (and not a special case like lookup_value with output_mappings, conditional_mapping, or entry_relationship_group). Rule: {rule}")
+        logger.warning("Rule (type: %s) missing output_field (and not a special case like lookup_value with output_mappings, conditional_mapping, or entry_relationship_group). Rule: %s", rt, rule)
         return
 
     if rt == "direct_mapping":
@@ -232,7 +267,7 @@ def _apply_single_rule(
                 _set_nested_attr(output_target, of, val)
 
         current_val_debug = output_target.get(of) if is_dict_target else getattr(output_target, of, "NOT_SET") # This getattr might fail for nested
-        logger.debug(f"DEFAULT_VALUE: rule={rule}, input_field_condition='{cond_f}', value_in_input='{i_rec.get(cond_f)}', apply_default={apply_default}, output_field='{of}', value_set='{current_val_debug}'")
+        logger.debug("DEFAULT_VALUE: rule=%s, input_field_condition='%s', value_in_input='%s', apply_default=%s, output_field='%s', value_set='%s'", rule, cond_f, i_rec.get(cond_f), apply_default, of, current_val_debug)
     elif rt == "data_type_conversion":
         conv_type = rule.get("conversion_type")
         val = i_rec.get(inf)
@@ -283,7 +318,7 @@ def _apply_single_rule(
         lookup_k = str(key_s_v) if key_s_v is not None else None
         tbl_n = rule.get("lookup_table_name")
         # Ensure 'of' is handled correctly or if output_mappings is present
-        logger.debug(f"LOOKUP_VALUE: lookup_input_field='{inf}', key_source_value='{key_s_v}', final_lookup_key='{lookup_k}', table_name='{tbl_n}'")
+        logger.debug("LOOKUP_VALUE: lookup_input_field='%s', key_source_value='%s', final_lookup_key='%s', table_name='%s'", inf, key_s_v, lookup_k, tbl_n)
         if not tbl_n:
             raise RuleApplicationError(f"Lookup rule missing table_name: {rule}")
         if not lookups:
@@ -293,18 +328,18 @@ def _apply_single_rule(
             raise RuleApplicationError("Lookup tables not provided")
         actual_table = lookups.get(tbl_n)
         if actual_table is None:
-            logger.warning(f"LOOKUP_VALUE: Lookup table \"{tbl_n}\" not found. Available: {list(lookups.keys())}")
+            logger.warning("LOOKUP_VALUE: Lookup table \"%s\" not found. Available: %s", tbl_n, list(lookups.keys()))
             # Handle default_on_miss for single output_field if output_mappings not present
             if of and not rule.get("output_mappings"):
                 if is_dict_target: output_target[of] = rule.get("default_on_miss")
                 else: _set_nested_attr(output_target, of, rule.get("default_on_miss"))
             return
-        logger.debug(f"LOOKUP_VALUE: Table \"{tbl_n}\" sample keys: {list(actual_table.keys())[:5] if actual_table else 'TABLE_IS_EMPTY_OR_NONE'}. Attempting to get key: \"{lookup_k}\".")
+        logger.debug("LOOKUP_VALUE: Table \"%s\" sample keys: %s. Attempting to get key: \"%s\".", tbl_n, list(actual_table.keys())[:5] if actual_table else 'TABLE_IS_EMPTY_OR_NONE', lookup_k)
         result = actual_table.get(lookup_k, rule.get("default_on_miss"))
 
         output_mappings = rule.get("output_mappings")
         if output_mappings and isinstance(result, dict):
-            logger.debug(f"LOOKUP_VALUE: Applying output_mappings. Lookup result: {result}")
+            logger.debug("LOOKUP_VALUE: Applying output_mappings. Lookup result: %s", result)
             for mapping in output_mappings:
                 source_key = mapping.get("source_key_from_lookup")
                 target_prop = mapping.get("target_property")
@@ -316,15 +351,15 @@ def _apply_single_rule(
                     else:
                         _set_nested_attr(output_target, target_prop, value_to_set)
                 else:
-                    logger.warning(f"Invalid mapping {mapping} in rule: {rule}")
+                    logger.warning("Invalid mapping %s in rule: %s", mapping, rule)
         elif of: # Original behavior: assign whole result to single output_field 'of'
             if is_dict_target:
                 output_target[of] = result
             else:
                 _set_nested_attr(output_target, of, result)
-            logger.debug(f"LOOKUP_VALUE: output_field='{of}', looked_up_value='{result}' (single field assignment)")
+            logger.debug("LOOKUP_VALUE: output_field='%s', looked_up_value='%s' (single field assignment)", of, result)
         else:
-            logger.warning(f"LOOKUP_VALUE: Rule for input_field '{inf}' has neither 'output_field' nor 'output_mappings'. Lookup result not assigned. Rule: {rule}")
+            logger.warning("LOOKUP_VALUE: Rule for input_field '%s' has neither 'output_field' nor 'output_mappings'. Lookup result not assigned. Rule: %s", inf, rule)
     elif rt == "concat":
         inputs = rule.get("input_fields", [])
         delim = rule.get("delimiter", "")
@@ -336,7 +371,7 @@ def _apply_single_rule(
             _set_nested_attr(output_target, of, concatenated)
     elif rt == "split":
         if not inf:
-            logger.warning(f"Split rule missing input_field: {rule}")
+            logger.warning("Split rule missing input_field: %s", rule)
             return
         delim = rule.get("delimiter", "")
         parts = str(i_rec.get(inf, "")).split(delim)
@@ -350,7 +385,7 @@ def _apply_single_rule(
     elif rt == "create_nested_object":
         class_name = rule.get("class_name")
         if not class_name:
-            logger.warning(f"create_nested_object rule missing class_name: {rule}")
+            logger.warning("create_nested_object rule missing class_name: %s", rule)
             return
         try:
             from .. import models
@@ -361,7 +396,7 @@ def _apply_single_rule(
             else:
                 _set_nested_attr(output_target, of, instance)
         except Exception as e:
-            logger.error(f"Failed to create instance for {class_name}: {e}")
+            logger.error("Failed to create instance for %s: %s", class_name, e)
     elif rt == "calculate":
         calculation_name = rule.get("calculation_name")
         input_mapping = rule.get("input_mapping", [])
@@ -423,15 +458,15 @@ def _apply_single_rule(
 
                 kwargs[param_name] = converted_value
 
-            logger.debug(f"Calling calculation function '{calculation_name}' with args: {kwargs}")
+            logger.debug("Calling calculation function '%s' with args: %s", calculation_name, kwargs)
             calculated_value = calc_func(**kwargs)
 
             if is_dict_target: output_target[output_field] = calculated_value
             else: _set_nested_attr(output_target, output_field, calculated_value)
-            logger.debug(f"CALCULATE: output_field='{output_field}', calculated_value='{calculated_value}'")
+            logger.debug("CALCULATE: output_field='%s', calculated_value='%s'", output_field, calculated_value)
 
         except Exception as e:
-            logger.error(f"Error during 'calculate' rule execution for '{calculation_name}': {e}", exc_info=True)
+            logger.error("Error during 'calculate' rule execution for '%s': %s", calculation_name, e, exc_info=True)
             if hasattr(output_target, 'errors') and isinstance(getattr(output_target, 'errors'), list):
                  getattr(output_target, 'errors').append(f"Calculation error for {calculation_name}: {e}")
     elif rt == "conditional_mapping":
@@ -463,7 +498,7 @@ def _apply_single_rule(
             "entry_relationship_typeCode": er_type_code,
             "components": processed_components
         })
-    elif rt not in [None, "comment"]: logger.warning(f"Unknown rule_type: {rt} in rule {rule}")
+    elif rt not in [None, "comment"]: logger.warning("Unknown rule_type: %s in rule %s", rt, rule)
 
 def apply_rules(data: List[Dict[str, Any]], rules: List[Dict[str, Any]], model_class: type, lookup_tables: Optional[Dict[str, Dict[str, Any]]] = None) -> List[IntermediateRecord]:
     if lookup_tables is None:
@@ -472,20 +507,36 @@ def apply_rules(data: List[Dict[str, Any]], rules: List[Dict[str, Any]], model_c
         try:
             oid_path = Path(__file__).resolve().parents[3] / "config_rules/oid_catalog.json"
             if oid_path.exists():
-                with open(oid_path, "r", encoding="utf-8") as fp:
-                    lookup_tables["$oid_catalog$"] = json.load(fp)
+                if _fast_json is not None:
+                    lookup_tables["$oid_catalog$"] = _fast_json.loads(
+                        oid_path.read_bytes()
+                    )
+                else:
+                    with open(oid_path, "r", encoding="utf-8") as fp:
+                        lookup_tables["$oid_catalog$"] = json.load(fp)
         except Exception as e:  # pragma: no cover - loading should be best effort
-            logger.warning(f"Failed loading OID catalog: {e}")
+            logger.warning("Failed loading OID catalog: %s", e)
+
+    # Comment/no-op rules are dropped once here instead of being
+    # re-dispatched for every record; original indices are kept so error
+    # messages still point at the position in the rules file. The model
+    # class check is likewise hoisted out of the per-record loop.
+    active_rules = [
+        (rule_idx, rule_def)
+        for rule_idx, rule_def in enumerate(rules)
+        if rule_def.get("rule_type") not in (None, "comment")
+    ]
+    is_intermediate_model = issubclass(model_class, IntermediateRecord)
+    if not is_intermediate_model:
+        logger.warning("Model class %s does not inherit from IntermediateRecord. raw_input_data and errors fields might be unavailable.", model_class.__name__)
 
     transformed_data: List[IntermediateRecord] = []
     for rec_idx, input_rec in enumerate(data):
         model_instance = model_class()
-        if isinstance(model_instance, IntermediateRecord):
+        if is_intermediate_model:
             model_instance.raw_input_data = input_rec.copy()
-        else:
-            logger.warning(f"Model class {model_class.__name__} does not inherit from IntermediateRecord. raw_input_data and errors fields might be unavailable.")
 
-        for rule_idx, rule_def in enumerate(rules):
+        for rule_idx, rule_def in active_rules:
             try:
                 # Apply the rule directly; _apply_single_rule handles the specifics
                 _apply_single_rule(rule_def, input_rec, model_instance, lookup_tables)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from os import PathLike
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
 from lxml import etree
 
@@ -12,15 +12,21 @@ from lxml import etree
 logger = logging.getLogger(__name__)
 
 
-def parse_xml(path: Union[str, PathLike[str]]) -> Optional[etree._ElementTree]:
+def parse_xml(
+    path: Union[str, PathLike[str], IO[bytes]],
+) -> Optional[etree._ElementTree]:
     """Return an ``ElementTree`` for ``path`` or ``None`` on error.
 
     Parameters
     ----------
     path:
-        Path to an XML file. Accepts :class:`str` or :class:`os.PathLike`.
+        Path to an XML file (:class:`str` or :class:`os.PathLike`) or an
+        open binary file-like object, which is handed to ``etree.parse``
+        as-is.
     """
     try:
+        if hasattr(path, "read"):
+            return etree.parse(path)
         return etree.parse(str(path))
     except etree.XMLSyntaxError as exc:
         logger.error("XMLSyntaxError parsing %s: %s", path, exc)
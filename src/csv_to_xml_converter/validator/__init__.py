@@ -4,12 +4,64 @@ XML Validator module using lxml.etree.XMLSchema.
 """
 import logging
 import os
+import threading
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Compiled schemas cached per thread and keyed on (absolute path, mtime).
+# Compiling an XMLSchema is the expensive part of validation; the cache is
+# thread-local because lxml validators must not be shared across threads.
+# The parsed XSD trees behind them live in a process-global map: lxml
+# trees may be shared across threads as long as nothing modifies them,
+# so parsing (and prewarming) happens once per process while compilation
+# stays per thread.
+_SCHEMA_CACHE = threading.local()
+_XSD_TREE_CACHE: dict = {}
+_XSD_TREE_LOCK = threading.Lock()
+
+
+def _parse_schema_tree(abs_path: str, key) -> etree._ElementTree:
+    """Return the parsed (read-only) XSD tree for ``abs_path``, memoized."""
+    with _XSD_TREE_LOCK:
+        tree = _XSD_TREE_CACHE.get(key)
+        if tree is None:
+            tree = _XSD_TREE_CACHE[key] = etree.parse(abs_path)
+    return tree
+
+
+def _schema_cache_key(xsd_file_path: str):
+    abs_path = os.path.abspath(xsd_file_path)
+    return abs_path, (abs_path, os.stat(abs_path).st_mtime_ns)
+
+
+def prewarm_schema(xsd_file_path: str) -> None:
+    """Parse ``xsd_file_path`` into the shared tree cache.
+
+    Used at startup so validation threads skip the disk read and parse;
+    compilation itself is per thread and cannot be warmed from here.
+    """
+    abs_path, key = _schema_cache_key(xsd_file_path)
+    _parse_schema_tree(abs_path, key)
+
+
+def _load_schema(xsd_file_path: str) -> etree.XMLSchema:
+    """Return a compiled ``XMLSchema`` for ``xsd_file_path``, memoized.
+
+    Editing the XSD changes its mtime and invalidates the cached entry.
+    Callers must treat the returned schema as read-only.
+    """
+    abs_path, key = _schema_cache_key(xsd_file_path)
+    cache = getattr(_SCHEMA_CACHE, "schemas", None)
+    if cache is None:
+        cache = _SCHEMA_CACHE.schemas = {}
+    schema = cache.get(key)
+    if schema is None:
+        schema = cache[key] = etree.XMLSchema(_parse_schema_tree(abs_path, key))
+    return schema
+
 
 class XMLValidationError(Exception):
     """Custom exception for XML validation specific issues.
@@ -20,15 +72,32 @@ class XMLValidationError(Exception):
 
 
 def validate_xml(
-    xml_string: str, xsd_file_path: str
+    xml_string: Union[str, etree._Element, etree._ElementTree],
+    xsd_file_path: Union[str, etree.XMLSchema],
 ) -> Tuple[bool, List[str]]:
+    """Validate an XML document against an XSD.
+
+    ``xml_string`` is normally the serialized document, but an already
+    built ``_Element``/``_ElementTree`` is validated directly, skipping
+    the serialize-and-reparse round trip. ``xsd_file_path`` is normally
+    a path, loaded through the per-thread schema cache, but callers that
+    already hold a compiled ``etree.XMLSchema`` may pass it directly to
+    skip the path lookup.
+    """
     error_messages = []
-    if not os.path.exists(xsd_file_path):
+    if isinstance(xsd_file_path, etree.XMLSchema):
+        xmlschema = xsd_file_path
+    elif not os.path.exists(xsd_file_path):
         raise XMLValidationError(f"XSD file not found: {xsd_file_path}")
+    else:
+        xmlschema = None
     try:
-        xsd_doc = etree.parse(xsd_file_path)
-        xmlschema = etree.XMLSchema(xsd_doc)
-        xml_doc_tree = etree.fromstring(xml_string.encode("utf-8"))
+        if xmlschema is None:
+            xmlschema = _load_schema(xsd_file_path)
+        if isinstance(xml_string, (etree._Element, etree._ElementTree)):
+            xml_doc_tree = xml_string
+        else:
+            xml_doc_tree = etree.fromstring(xml_string.encode("utf-8"))
         is_valid = xmlschema.validate(xml_doc_tree)
         if not is_valid:
             for error in xmlschema.error_log:
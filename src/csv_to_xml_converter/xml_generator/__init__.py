@@ -10,7 +10,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 logger.debug(
-    f"xml_generator/__init__.py loaded from: {os.path.abspath(__file__)}"
+    "xml_generator/__init__.py loaded from: %s", os.path.abspath(__file__)
 )
 
 # Import the new parsing utilities so they are accessible via the package
@@ -50,6 +50,36 @@ NSMAP_MHLW_DEFAULT = {None: MHLW_NS_URL, "xsi": XSI_NS}
 NSMAP_HL7_DEFAULT = {None: HL7_V3_NS, "xsi": XSI_NS, "dt": MHLW_NS_URL}
 NSMAP_MHLW_GUIDANCE_CLAIM = {None: MHLW_GUIDANCE_CLAIM_NS, "xsi": XSI_NS, "dt": MHLW_DATATYPE_NS}
 
+# Clark-notation tag/attribute names and schemaLocation values are
+# pre-rendered once at import so the generators do not rebuild identical
+# "{namespace}tag" strings for every element they emit.
+XSI_SCHEMA_LOCATION_ATTR = f"{{{XSI_NS}}}schemaLocation"
+XSI_TYPE_ATTR = f"{{{XSI_NS}}}type"
+_MHLW_QN = {
+    name: f"{{{MHLW_NS_URL}}}{name}"
+    for name in (
+        "family", "given", "low", "high", "checkupClaim", "encounter",
+        "subjectPerson", "patientId", "checkupOrgId", "insurerId",
+        "checkupCard", "copaymentType", "settlement", "claimType",
+        "commissionType", "totalPoints", "totalCost", "copaymentAmount",
+        "claimAmount",
+    )
+}
+_DT_ID_QN = f"{{{MHLW_DATATYPE_NS}}}id"
+_GC_DOCUMENT_QN = f"{{{MHLW_GUIDANCE_CLAIM_NS}}}GuidanceClaimDocument"
+INDEX_SCHEMA_LOCATION = f"{MHLW_NS_URL} ix08_V08.xsd"
+SUMMARY_SCHEMA_LOCATION = f"{MHLW_NS_URL} su08_V08.xsd"
+HC_CDA_SCHEMA_LOCATION = (
+    f"{HL7_V3_NS} hc08_V08.xsd {MHLW_NS_URL} coreschemas/datatypes_hcgv08.xsd"
+)
+HG_CDA_SCHEMA_LOCATION = (
+    f"{HL7_V3_NS} hg08_V08.xsd {MHLW_NS_URL} coreschemas/datatypes_hcgv08.xsd"
+)
+CC08_SCHEMA_LOCATION = f"{MHLW_NS_URL} cc08_V08.xsd"
+GC08_SCHEMA_LOCATION = (
+    f"{MHLW_GUIDANCE_CLAIM_NS} gc08_V08.xsd {MHLW_DATATYPE_NS} datatypes_hcgv08.xsd"
+)
+
 def _str_or_default(value: Any, default_str: str = "") -> str:
     return str(value) if value is not None else default_str
 
@@ -70,13 +100,19 @@ def _create_ii_element(parent_el: etree._Element, el_name: str, item_data: Any,
         root_val = getattr(item_data, 'root', None)
         extension_val = getattr(item_data, 'extension', None)
     else:
-        try:
-            data_items = item_data.items() if isinstance(item_data, dict) else []
-            logger.debug(
-                f"Attempting to create II element: el_name='{el_name}', id_prefix='{id_prefix}' with data: { {k: v for k, v in data_items if k.startswith(id_prefix)} }"
-            )
-        except Exception:
-            pass
+        # The dict comprehension below is only worth building when DEBUG
+        # is actually emitted; this helper runs once per II element.
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                data_items = item_data.items() if isinstance(item_data, dict) else []
+                logger.debug(
+                    "Attempting to create II element: el_name='%s', id_prefix='%s' with data: %s",
+                    el_name,
+                    id_prefix,
+                    {k: v for k, v in data_items if k.startswith(id_prefix)},
+                )
+            except Exception:
+                pass
         root_val = _get_value(item_data, f"{id_prefix}RootOid")
         if root_val is None:
             root_val = _get_value(item_data, f"{id_prefix}Root")
@@ -144,9 +180,9 @@ def _create_mo_element(parent_el: etree._Element, el_name: str, item_data: Any,
 
 # --- Fully Restored XML Generators ---
 def generate_index_xml(transformed_data: Dict[str, Any] | Any) -> str:
-    schema_loc_val = f"{MHLW_NS_URL} ix08_V08.xsd"
+    schema_loc_val = INDEX_SCHEMA_LOCATION
     root = etree.Element("index", nsmap=NSMAP_MHLW_DEFAULT)
-    root.set(f"{{{XSI_NS}}}schemaLocation", schema_loc_val)
+    root.set(XSI_SCHEMA_LOCATION_ATTR, schema_loc_val)
     etree.SubElement(root, "interactionType").set("code", _str_or_default(_get_value(transformed_data, "interactionType"), "1"))
     etree.SubElement(root, "creationTime").set("value", _str_or_default(_get_value(transformed_data, "creationTime")))
     sender_el = etree.SubElement(root, "sender")
@@ -158,9 +194,9 @@ def generate_index_xml(transformed_data: Dict[str, Any] | Any) -> str:
     return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-8").decode("utf-8")
 
 def generate_summary_xml(transformed_data: Dict[str, Any] | Any) -> str:
-    schema_loc_val = f"{MHLW_NS_URL} su08_V08.xsd"
+    schema_loc_val = SUMMARY_SCHEMA_LOCATION
     root = etree.Element("summary", nsmap=NSMAP_MHLW_DEFAULT)
-    root.set(f"{{{XSI_NS}}}schemaLocation", schema_loc_val)
+    root.set(XSI_SCHEMA_LOCATION_ATTR, schema_loc_val)
 
     set_code = _get_value(transformed_data, "serviceEventTypeCode")
     if set_code is not None:
@@ -176,7 +212,7 @@ def generate_summary_xml(transformed_data: Dict[str, Any] | Any) -> str:
     return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-8").decode("utf-8")
 
 def _populate_cda_header(doc: etree._Element, transformed_data: Dict[str, Any], document_profile_type: Optional[str] = None):
-    logger.debug(f"Entering _populate_cda_header for profile: {document_profile_type}. Data keys: {list(transformed_data.keys())}")
+    logger.debug("Entering _populate_cda_header for profile: %s. Data keys: %s", document_profile_type, list(transformed_data.keys()))
     try:
         _create_ii_element(doc, "typeId", transformed_data, "typeId")
         _create_ii_element(doc, "id", transformed_data, "documentId")
@@ -193,8 +229,8 @@ def _populate_cda_header(doc: etree._Element, transformed_data: Dict[str, Any],
             _create_ii_element(pr_el, "id", transformed_data, "patientIdInsuranceNo")
         patient_el = etree.SubElement(pr_el, "patient")
         name_el = etree.SubElement(patient_el, "name")
-        etree.SubElement(name_el, f"{{{MHLW_NS_URL}}}family").text = _str_or_default(transformed_data.get("patientNameFamily"))
-        etree.SubElement(name_el, f"{{{MHLW_NS_URL}}}given").text = _str_or_default(transformed_data.get("patientNameGiven"))
+        etree.SubElement(name_el, _MHLW_QN["family"]).text = _str_or_default(transformed_data.get("patientNameFamily"))
+        etree.SubElement(name_el, _MHLW_QN["given"]).text = _str_or_default(transformed_data.get("patientNameGiven"))
         _create_cd_element(patient_el, "administrativeGenderCode", transformed_data, "patientGender")
         etree.SubElement(patient_el, "birthTime").set("value", _str_or_default(transformed_data.get("patientBirthTimeValue")))
 
@@ -209,7 +245,7 @@ def _populate_cda_header(doc: etree._Element, transformed_data: Dict[str, Any],
 
 
         if document_profile_type != "HC08": # Skip documentationOf entirely for HC08
-            logger.debug(f"Profile {document_profile_type}: Generating documentationOf section.")
+            logger.debug("Profile %s: Generating documentationOf section.", document_profile_type)
             # --- documentationOf section START ---
             doc_of_el = etree.SubElement(doc, "documentationOf")
 
@@ -238,23 +274,23 @@ def _populate_cda_header(doc: etree._Element, transformed_data: Dict[str, Any],
                 se_eff_time_el.set("value", _str_or_default(low_val))
             else:
                 if document_profile_type == "HG08":
-                    logger.debug(f"HG08 profile: Using MHLW namespace for low/high. Low: {low_val}, High: {high_val}")
+                    logger.debug("HG08 profile: Using MHLW namespace for low/high. Low: %s, High: %s", low_val, high_val)
                     if low_val:
-                        etree.SubElement(se_eff_time_el, f"{{{MHLW_NS_URL}}}low").set("value", _str_or_default(low_val))
+                        etree.SubElement(se_eff_time_el, _MHLW_QN["low"]).set("value", _str_or_default(low_val))
                     if high_val:
-                        etree.SubElement(se_eff_time_el, f"{{{MHLW_NS_URL}}}high").set("value", _str_or_default(high_val))
+                        etree.SubElement(se_eff_time_el, _MHLW_QN["high"]).set("value", _str_or_default(high_val))
                 else: # For other profiles (e.g. future ones, or if HC08 were to include it differently)
-                    logger.debug(f"Non-HG08/Non-HC08 profile: Using default namespace for low/high. Low: {low_val}, High: {high_val}")
+                    logger.debug("Non-HG08/Non-HC08 profile: Using default namespace for low/high. Low: %s, High: %s", low_val, high_val)
                     if low_val:
                         etree.SubElement(se_eff_time_el, "low").set("value", _str_or_default(low_val))
                     if high_val:
                         etree.SubElement(se_eff_time_el, "high").set("value", _str_or_default(high_val))
             # --- documentationOf section END ---
         else:
-            logger.debug(f"Profile {document_profile_type}: Skipping documentationOf section.")
+            logger.debug("Profile %s: Skipping documentationOf section.", document_profile_type)
 
     except Exception as e:
-        logger.error(f"Error in _populate_cda_header (profile: {document_profile_type}): {e}", exc_info=True)
+        logger.error("Error in _populate_cda_header (profile: %s): %s", document_profile_type, e, exc_info=True)
         raise
 
 # --- CDA Observation Helper Functions ---
@@ -266,7 +302,7 @@ def _create_observation_pq(parent_el: etree._Element, item_data: Dict[str, Any],
     _create_cd_element(obs_el, "code", item_data, item_prefix)
     if item_data.get(val_key) is not None:
         val_el = etree.SubElement(obs_el, "value")
-        val_el.set(f"{{{XSI_NS}}}type", "dt:PQ")
+        val_el.set(XSI_TYPE_ATTR, "dt:PQ")
         val_el.set("value", _str_or_default(item_data.get(val_key)))
         val_el.set("unit", _str_or_default(item_data.get(f"{item_prefix}_unit" if item_prefix else "unit")))
 
@@ -278,7 +314,7 @@ def _create_observation_cd(parent_el: etree._Element, item_data: Dict[str, Any],
     _create_cd_element(obs_el, "code", {"code":item_data.get(obs_code_key), "codeSystem":item_data.get(f"{item_prefix}_item_codeSystem" if item_prefix else "codeSystem"), "displayName":item_data.get(f"{item_prefix}_item_displayName" if item_prefix else "displayName")}, "")
     if item_data.get(val_code_key) is not None:
         val_el = etree.SubElement(obs_el, "value")
-        val_el.set(f"{{{XSI_NS}}}type", "dt:CD")
+        val_el.set(XSI_TYPE_ATTR, "dt:CD")
         _create_cd_element(
             val_el,
             "",
@@ -303,7 +339,7 @@ def _create_observation_int(parent_el: etree._Element, item_data: Dict[str, Any]
     _create_cd_element(obs_el, "code", item_data, item_prefix)
     if item_data.get(val_key) is not None:
         val_el = etree.SubElement(obs_el, "value")
-        val_el.set(f"{{{XSI_NS}}}type", "dt:INT")
+        val_el.set(XSI_TYPE_ATTR, "dt:INT")
         val_el.set("value", _str_or_default(item_data.get(val_key)))
 
 def generate_health_checkup_cda(transformed_data: Union[Dict[str, Any], Any]) -> etree._Element:  # Merged with ER logic
@@ -313,7 +349,7 @@ def generate_health_checkup_cda(transformed_data: Union[Dict[str, Any], Any]) ->
         transformed_dict = transformed_data
 
     doc = etree.Element("ClinicalDocument", nsmap=NSMAP_HL7_DEFAULT)
-    doc.set(f"{{{XSI_NS}}}schemaLocation", f"{HL7_V3_NS} hc08_V08.xsd {MHLW_NS_URL} coreschemas/datatypes_hcgv08.xsd")
+    doc.set(XSI_SCHEMA_LOCATION_ATTR, HC_CDA_SCHEMA_LOCATION)
     _populate_cda_header(doc, transformed_dict, document_profile_type="HC08")
     body_comp = etree.SubElement(doc, "component", typeCode="COMP")
     structured_body = etree.SubElement(body_comp, "structuredBody")
@@ -332,7 +368,7 @@ def generate_health_checkup_cda(transformed_data: Union[Dict[str, Any], Any]) ->
         iterator = []
     for key, value in iterator:
         if isinstance(value, list) and key.endswith("_er_group"): # Convention
-            logger.debug(f"Processing ER group: {key}")
+            logger.debug("Processing ER group: %s", key)
             for group_instance in value:
                 parent_obs_data = group_instance.get("parent_obs_data")
                 current_parent_for_er = results_sect
@@ -374,7 +410,7 @@ def generate_health_guidance_cda(transformed_data: Union[Dict[str, Any], Any]) -
         transformed_dict = transformed_data
 
     doc = etree.Element("ClinicalDocument", nsmap=NSMAP_HL7_DEFAULT)
-    doc.set(f"{{{XSI_NS}}}schemaLocation", f"{HL7_V3_NS} hg08_V08.xsd {MHLW_NS_URL} coreschemas/datatypes_hcgv08.xsd")
+    doc.set(XSI_SCHEMA_LOCATION_ATTR, HG_CDA_SCHEMA_LOCATION)
     _populate_cda_header(doc, transformed_dict, document_profile_type="HG08")
     # Simplified body for now -  needs full structure similar to HC CDA if ER groups are used here too
     body_comp = etree.SubElement(doc, "component", typeCode="COMP")
@@ -389,40 +425,40 @@ def generate_checkup_settlement_xml(transformed_data: Union[Dict[str, Any], Any]
         data_dict = transformed_data.to_xml_dict()
     else:
         data_dict = transformed_data
-    schema_loc_val = f"{MHLW_NS_URL} cc08_V08.xsd"
-    root = etree.Element(f"{{{MHLW_NS_URL}}}checkupClaim", nsmap=NSMAP_MHLW_DEFAULT)
-    root.set(f"{{{XSI_NS}}}schemaLocation", schema_loc_val)
+    schema_loc_val = CC08_SCHEMA_LOCATION
+    root = etree.Element(_MHLW_QN["checkupClaim"], nsmap=NSMAP_MHLW_DEFAULT)
+    root.set(XSI_SCHEMA_LOCATION_ATTR, schema_loc_val)
     root.set("docId", _str_or_default(_get_value(data_dict, "documentId")))
-    etree.SubElement(root, f"{{{MHLW_NS_URL}}}encounter").text = _str_or_default(_get_value(data_dict, "encounterDetails"), "Checkup Encounter")
-    sp_el = etree.SubElement(root, f"{{{MHLW_NS_URL}}}subjectPerson")
-    _create_ii_element(sp_el, f"{{{MHLW_NS_URL}}}patientId", _get_value(transformed_data, 'patient_id_mrn') or data_dict, "patientIdMrn")
-    _create_ii_element(sp_el, f"{{{MHLW_NS_URL}}}checkupOrgId", _get_value(transformed_data, 'checkup_org_id') or data_dict, "checkupOrgId")
-    _create_ii_element(sp_el, f"{{{MHLW_NS_URL}}}insurerId", _get_value(transformed_data, 'insurer_id') or data_dict, "insurerId")
+    etree.SubElement(root, _MHLW_QN["encounter"]).text = _str_or_default(_get_value(data_dict, "encounterDetails"), "Checkup Encounter")
+    sp_el = etree.SubElement(root, _MHLW_QN["subjectPerson"])
+    _create_ii_element(sp_el, _MHLW_QN["patientId"], _get_value(transformed_data, 'patient_id_mrn') or data_dict, "patientIdMrn")
+    _create_ii_element(sp_el, _MHLW_QN["checkupOrgId"], _get_value(transformed_data, 'checkup_org_id') or data_dict, "checkupOrgId")
+    _create_ii_element(sp_el, _MHLW_QN["insurerId"], _get_value(transformed_data, 'insurer_id') or data_dict, "insurerId")
     copay_obj = _get_value(transformed_data, 'copayment_type') or data_dict
     if _get_value(copay_obj, "Code") or _get_value(copay_obj, "code"):
-        card_el = etree.SubElement(root, f"{{{MHLW_NS_URL}}}checkupCard")
-        _create_cd_element(card_el, f"{{{MHLW_NS_URL}}}copaymentType", copay_obj, "copaymentType")
-    settlement_el = etree.SubElement(root, f"{{{MHLW_NS_URL}}}settlement")
-    _create_cd_element(settlement_el, f"{{{MHLW_NS_URL}}}claimType", _get_value(transformed_data, 'claim_type') or data_dict, "claimType")
+        card_el = etree.SubElement(root, _MHLW_QN["checkupCard"])
+        _create_cd_element(card_el, _MHLW_QN["copaymentType"], copay_obj, "copaymentType")
+    settlement_el = etree.SubElement(root, _MHLW_QN["settlement"])
+    _create_cd_element(settlement_el, _MHLW_QN["claimType"], _get_value(transformed_data, 'claim_type') or data_dict, "claimType")
     comm_obj = _get_value(transformed_data, 'commission_type') or data_dict
     if _get_value(comm_obj, "Code") or _get_value(comm_obj, "code"):
-        _create_cd_element(settlement_el, f"{{{MHLW_NS_URL}}}commissionType", comm_obj, "commissionType")
-    _create_int_element(settlement_el, f"{{{MHLW_NS_URL}}}totalPoints", _get_value(transformed_data, 'total_points_value') or data_dict, "totalPoints")
+        _create_cd_element(settlement_el, _MHLW_QN["commissionType"], comm_obj, "commissionType")
+    _create_int_element(settlement_el, _MHLW_QN["totalPoints"], _get_value(transformed_data, 'total_points_value') or data_dict, "totalPoints")
 
     # Manual creation for MO-like fields in CC08 that don't allow @currency
     total_cost_val = _get_value(transformed_data, "total_cost_value") or _get_value(data_dict, "totalCostValue")
     if total_cost_val is not None:
-        tc_el = etree.SubElement(settlement_el, f"{{{MHLW_NS_URL}}}totalCost")
+        tc_el = etree.SubElement(settlement_el, _MHLW_QN["totalCost"])
         tc_el.set("value", _str_or_default(total_cost_val))
 
     copay_val = _get_value(transformed_data, "copayment_amount_value") or _get_value(data_dict, "copaymentAmountValue")
     if copay_val is not None:
-        cp_el = etree.SubElement(settlement_el, f"{{{MHLW_NS_URL}}}copaymentAmount")
+        cp_el = etree.SubElement(settlement_el, _MHLW_QN["copaymentAmount"])
         cp_el.set("value", _str_or_default(copay_val))
 
     claim_val = _get_value(transformed_data, "claim_amount_value") or _get_value(data_dict, "claimAmountValue")
     if claim_val is not None:
-        ca_el = etree.SubElement(settlement_el, f"{{{MHLW_NS_URL}}}claimAmount")
+        ca_el = etree.SubElement(settlement_el, _MHLW_QN["claimAmount"])
         ca_el.set("value", _str_or_default(claim_val))
 
     return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-8").decode("utf-8")
@@ -432,21 +468,21 @@ def generate_guidance_settlement_xml(transformed_data: Union[Dict[str, Any], Any
         data_dict = transformed_data.to_xml_dict()
     else:
         data_dict = transformed_data
-    schema_loc_val = f"{MHLW_GUIDANCE_CLAIM_NS} gc08_V08.xsd {MHLW_DATATYPE_NS} datatypes_hcgv08.xsd"
-    root = etree.Element(f"{{{MHLW_GUIDANCE_CLAIM_NS}}}GuidanceClaimDocument", nsmap=NSMAP_MHLW_GUIDANCE_CLAIM)
-    root.set(f"{{{XSI_NS}}}schemaLocation", schema_loc_val)
+    schema_loc_val = GC08_SCHEMA_LOCATION
+    root = etree.Element(_GC_DOCUMENT_QN, nsmap=NSMAP_MHLW_GUIDANCE_CLAIM)
+    root.set(XSI_SCHEMA_LOCATION_ATTR, schema_loc_val)
     _create_ii_element(root, "documentId", _get_value(transformed_data, 'document_id') or data_dict, "documentId")
     etree.SubElement(root, "creationTime").set("value", current_time_iso)
     author_inst_el = etree.SubElement(root, "authorInstitution")
-    _create_ii_element(author_inst_el, f"{{{MHLW_DATATYPE_NS}}}id", _get_value(transformed_data, 'author_institution_id') or data_dict, "guidanceOrgId")
+    _create_ii_element(author_inst_el, _DT_ID_QN, _get_value(transformed_data, 'author_institution_id') or data_dict, "guidanceOrgId")
     patient_el = etree.SubElement(root, "patient")
     _create_ii_element(patient_el, "id", _get_value(transformed_data, 'patient_id_mrn') or data_dict, "patientIdMrn")
     insurance_el = etree.SubElement(root, "healthInsurance")
     insurer_el = etree.SubElement(insurance_el, "insurer")
-    _create_ii_element(insurer_el, f"{{{MHLW_DATATYPE_NS}}}id", _get_value(transformed_data, 'insurer_id') or data_dict, "insurerId")
+    _create_ii_element(insurer_el, _DT_ID_QN, _get_value(transformed_data, 'insurer_id') or data_dict, "insurerId")
     encounter_el = etree.SubElement(root, "encounter")
     guidance_org_el_in_encounter = etree.SubElement(encounter_el, "guidanceOrg")
-    _create_ii_element(guidance_org_el_in_encounter, f"{{{MHLW_DATATYPE_NS}}}id", _get_value(transformed_data, 'encounter_guidance_org_id') or data_dict, "guidanceOrgId")
+    _create_ii_element(guidance_org_el_in_encounter, _DT_ID_QN, _get_value(transformed_data, 'encounter_guidance_org_id') or data_dict, "guidanceOrgId")
     _create_cd_element(encounter_el, "guidanceLevel", _get_value(transformed_data, 'guidance_level') or data_dict, "guidanceLevel")
     _create_cd_element(encounter_el, "timing", _get_value(transformed_data, 'timing') or data_dict, "timing")
     hg_card_el = etree.SubElement(root, "healthGuidanceCard")
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import IO, Optional, Union
 from lxml import etree
 
 from ..utils import parse_xml
@@ -23,52 +23,107 @@ NAMESPACES = {
     'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
 }
 
-# Map XML root tags to the XPath where their claim amounts are located.
-# This centralizes the mapping used by ``get_claim_amount``.
+# Map XML root tags to the compiled XPath locating their claim amounts.
+# Compiling once at import time (etree.XPath) skips re-parsing the
+# expression on every document; this centralizes the mapping used by
+# ``get_claim_amount``.
 CLAIM_AMOUNT_XPATHS = {
-    f"{{{NAMESPACES['mhlw']}}}checkupClaim":
+    f"{{{NAMESPACES['mhlw']}}}checkupClaim": etree.XPath(
         "/mhlw:checkupClaim/mhlw:settlement/mhlw:claimAmount/@value",
-    f"{{{NAMESPACES['gc']}}}GuidanceClaimDocument":
+        namespaces=NAMESPACES,
+    ),
+    f"{{{NAMESPACES['gc']}}}GuidanceClaimDocument": etree.XPath(
         "/gc:GuidanceClaimDocument/gc:settlementDetails/gc:claimAmount/@value",
+        namespaces=NAMESPACES,
+    ),
 }
 
-def _extract_claim_amount(tree: etree._ElementTree, xpath: str) -> Optional[float]:
-    """Return the claim amount using ``xpath`` on a parsed tree."""
+def _extract_claim_amount(
+    tree: etree._ElementTree, xpath: etree.XPath
+) -> Optional[float]:
+    """Return the claim amount using compiled ``xpath`` on a parsed tree."""
     try:
-        values = tree.xpath(xpath, namespaces=NAMESPACES)
+        values = xpath(tree)
         if values:
             return float(values[0])
-        logger.warning("Could not find claimAmount using XPath %s", xpath)
+        logger.warning("Could not find claimAmount using XPath %s", xpath.path)
         return None
     except ValueError as exc:
         logger.error("ValueError converting claim amount: %s", exc)
         return None
 
 
-def _get_claim_amount_by_xpath(xml_path: str, xpath: str) -> Optional[float]:
-    """Return the claim amount for ``xml_path`` using ``xpath``."""
-    tree = parse_xml(xml_path)
-    if tree is None:
+# (claimAmount tag, parent tag, ..., root tag) chains checked against the
+# ancestry of each streamed element so only the documented location matches.
+_CC08_CLAIM_CHAIN = (
+    f"{{{NAMESPACES['mhlw']}}}claimAmount",
+    f"{{{NAMESPACES['mhlw']}}}settlement",
+    f"{{{NAMESPACES['mhlw']}}}checkupClaim",
+)
+_GC08_CLAIM_CHAIN = (
+    f"{{{NAMESPACES['gc']}}}claimAmount",
+    f"{{{NAMESPACES['gc']}}}settlementDetails",
+    f"{{{NAMESPACES['gc']}}}GuidanceClaimDocument",
+)
+
+
+def _get_claim_amount_streaming(
+    xml_path: Union[str, IO[bytes]], chain: tuple
+) -> Optional[float]:
+    """Return the claim amount located by ``chain`` via ``iterparse``.
+
+    Streams the input and frees every element once its end tag has been
+    seen, so peak memory is bounded by the open-element stack rather
+    than the document size. ``xml_path`` may be a filesystem path or an
+    open binary file-like object; ``iterparse`` accepts both.
+    """
+    amount_tag = chain[0]
+    ancestor_tags = list(chain[1:])
+    try:
+        for _, element in etree.iterparse(xml_path, events=("end",)):
+            if element.tag == amount_tag:
+                ancestry = []
+                parent = element.getparent()
+                while parent is not None:
+                    ancestry.append(parent.tag)
+                    parent = parent.getparent()
+                if ancestry == ancestor_tags:
+                    value = element.get("value")
+                    if value is not None:
+                        try:
+                            return float(value)
+                        except ValueError as exc:
+                            logger.error(
+                                "ValueError converting claim amount: %s", exc
+                            )
+                            return None
+            # Drop the finished element and its already-processed
+            # siblings; the ancestry check above only needs the tags of
+            # still-open ancestors.
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+        logger.warning(
+            "Could not find claimAmount at expected location in %s", xml_path
+        )
+        return None
+    except (etree.XMLSyntaxError, OSError) as exc:
+        logger.error("Failed to parse XML file %s: %s", xml_path, exc)
         return None
-    return _extract_claim_amount(tree, xpath)
 
 
-def get_claim_amount_from_cc08(xml_path: str) -> Optional[float]:
+def get_claim_amount_from_cc08(xml_path: Union[str, IO[bytes]]) -> Optional[float]:
     """Return the claim amount from a CC08 XML file."""
-    return _get_claim_amount_by_xpath(
-        xml_path,
-        "/mhlw:checkupClaim/mhlw:settlement/mhlw:claimAmount/@value",
-    )
+    return _get_claim_amount_streaming(xml_path, _CC08_CLAIM_CHAIN)
 
-def get_claim_amount_from_gc08(xml_path: str) -> Optional[float]:
+def get_claim_amount_from_gc08(xml_path: Union[str, IO[bytes]]) -> Optional[float]:
     """Return the claim amount from a GC08 XML file."""
-    return _get_claim_amount_by_xpath(
-        xml_path,
-        "/gc:GuidanceClaimDocument/gc:settlementDetails/gc:claimAmount/@value",
-    )
+    return _get_claim_amount_streaming(xml_path, _GC08_CLAIM_CHAIN)
 
 
-def get_claim_amount(xml_path: str) -> Optional[float]:
+def get_claim_amount(xml_path: Union[str, IO[bytes]]) -> Optional[float]:
     """Return the claim amount from either a CC08 or GC08 XML file."""
     tree = parse_xml(xml_path)
     if tree is None:
@@ -82,14 +137,22 @@ def get_claim_amount(xml_path: str) -> Optional[float]:
 
     return _extract_claim_amount(tree, xpath)
 
-def get_subject_count_from_cda(xml_path: str) -> int:
-    """Return the subject count from a CDA XML file."""
-    tree = parse_xml(xml_path)
-    if tree is None:
-        return 0
+def get_subject_count_from_cda(xml_path: Union[str, IO[bytes]]) -> int:
+    """Return the subject count from a CDA XML file.
 
-    if tree.xpath("/cda:ClinicalDocument", namespaces=NAMESPACES):
-        return 1
+    Only the root tag matters here, so the document is sniffed with
+    ``iterparse`` and abandoned after the first start event rather than
+    parsed into a full tree.
+    """
+    cda_root_tag = f"{{{NAMESPACES['cda']}}}ClinicalDocument"
+    try:
+        for _, element in etree.iterparse(xml_path, events=("start",)):
+            if element.tag == cda_root_tag:
+                return 1
+            break
+    except (etree.XMLSyntaxError, OSError) as exc:
+        logger.error("Failed to parse XML file %s: %s", xml_path, exc)
+        return 0
 
     logger.warning(
         "File %s does not appear to be a valid CDA XML for subject counting.",
@@ -20,56 +20,81 @@ rule files and XSD locations can be customised in the configuration JSON.
 import argparse
 import logging
 import os
-import zipfile
-from datetime import datetime
-from pathlib import Path
-
-from csv_to_xml_converter.config import load_config
-from csv_to_xml_converter.logger import setup_logger
-from csv_to_xml_converter.orchestrator import Orchestrator
+from pathlib import Path, PurePosixPath
 
 DEFAULT_CONFIG_FILE = "config_rules/config.json"
-DEEP_XSD_BASE = "5521111111_00280081_202405271_1/"
-# Official schemas reside inside the deeper directory under an "XSD" folder
-XSD_OFFICIAL_BASE = os.path.join(DEEP_XSD_BASE, "XSD/")
+DEEP_XSD_BASE = "5521111111_00280081_202405271_1"
+# Official schemas reside inside the deeper directory under an "XSD" folder.
+# The bases are precomputed PurePosixPath objects so the per-schema joins
+# happen once at import time instead of on every CLI invocation.
+XSD_OFFICIAL_BASE = PurePosixPath(DEEP_XSD_BASE) / "XSD"
 # General schemas remain in the top level "XSD" directory
-XSD_GENERAL_BASE = "XSD/"
+XSD_GENERAL_BASE = PurePosixPath("XSD")
+
+# Precomputed path-object bases so the per-file joins below happen once at
+# import time and downstream pathlib/os consumers skip string re-parsing.
+OUTPUT_XMLS_BASE = PurePosixPath("data/output_xmls")
+RULES_BASE = PurePosixPath("config_rules")
 
 # Define output paths for aggregated index and summary
 # Changed from ix08_output_V08.xml
-DEFAULT_INDEX_OUTPUT_XML = "data/output_xmls/index.xml"
+DEFAULT_INDEX_OUTPUT_XML = OUTPUT_XMLS_BASE / "index.xml"
 # Changed from su08_output_V08.xml
-DEFAULT_SUMMARY_OUTPUT_XML = "data/output_xmls/summary.xml"
-DEFAULT_INDEX_XSD_FILE = os.path.join(XSD_GENERAL_BASE, "ix08_V08.xsd")
-DEFAULT_SUMMARY_XSD_FILE = os.path.join(XSD_GENERAL_BASE, "su08_V08.xsd")
+DEFAULT_SUMMARY_OUTPUT_XML = OUTPUT_XMLS_BASE / "summary.xml"
+DEFAULT_INDEX_XSD_FILE = XSD_GENERAL_BASE / "ix08_V08.xsd"
+DEFAULT_SUMMARY_XSD_FILE = XSD_GENERAL_BASE / "su08_V08.xsd"
 
 # Paths for individual document generation (CDAs, Settlements)
-DEFAULT_CDA_FULL_RULES_FILE = "config_rules/health_checkup_full_rules.json"
-DEFAULT_CDA_FULL_XSD_FILE = os.path.join(XSD_OFFICIAL_BASE, "hc08_V08.xsd")
-DEFAULT_CDA_FULL_OUTPUT_DIR = "data/output_xmls/cda_checkup_full/"
+DEFAULT_CDA_FULL_RULES_FILE = RULES_BASE / "health_checkup_full_rules.json"
+DEFAULT_CDA_FULL_XSD_FILE = XSD_OFFICIAL_BASE / "hc08_V08.xsd"
+DEFAULT_CDA_FULL_OUTPUT_DIR = OUTPUT_XMLS_BASE / "cda_checkup_full"
 DEFAULT_CDA_FULL_FILE_PREFIX = "hc_cda_"
 
-DEFAULT_HG_CDA_FULL_RULES_FILE = "config_rules/health_guidance_full_rules.json"
-DEFAULT_HG_CDA_XSD_FILE = os.path.join(XSD_GENERAL_BASE, "hg08_V08.xsd")
-DEFAULT_HG_CDA_FULL_OUTPUT_DIR = "data/output_xmls/cda_guidance_full/"
+DEFAULT_HG_CDA_FULL_RULES_FILE = RULES_BASE / "health_guidance_full_rules.json"
+DEFAULT_HG_CDA_XSD_FILE = XSD_GENERAL_BASE / "hg08_V08.xsd"
+DEFAULT_HG_CDA_FULL_OUTPUT_DIR = OUTPUT_XMLS_BASE / "cda_guidance_full"
 DEFAULT_HG_CDA_FILE_PREFIX = "hg_cda_"
 
-DEFAULT_CS_RULES_FILE = "config_rules/checkup_settlement_rules.json"
-DEFAULT_CS_XSD_FILE = os.path.join(XSD_GENERAL_BASE, "cc08_V08.xsd")
-DEFAULT_CS_OUTPUT_DIR = "data/output_xmls/settlements_checkup/"
+DEFAULT_CS_RULES_FILE = RULES_BASE / "checkup_settlement_rules.json"
+DEFAULT_CS_XSD_FILE = XSD_GENERAL_BASE / "cc08_V08.xsd"
+DEFAULT_CS_OUTPUT_DIR = OUTPUT_XMLS_BASE / "settlements_checkup"
 DEFAULT_CS_FILE_PREFIX = "cs_"
 
-DEFAULT_GS_RULES_FILE = "config_rules/guidance_settlement_rules.json"
-DEFAULT_GS_XSD_FILE = os.path.join(XSD_GENERAL_BASE, "gc08_V08.xsd")
-DEFAULT_GS_OUTPUT_DIR = "data/output_xmls/settlements_guidance/"
+DEFAULT_GS_RULES_FILE = RULES_BASE / "guidance_settlement_rules.json"
+DEFAULT_GS_XSD_FILE = XSD_GENERAL_BASE / "gc08_V08.xsd"
+DEFAULT_GS_OUTPUT_DIR = OUTPUT_XMLS_BASE / "settlements_guidance"
 DEFAULT_GS_FILE_PREFIX = "gs_"
 # Paths for Grouped Checkup CDA Test
-DEFAULT_GROUPED_CHECKUP_RULES_FILE = "config_rules/grouped_checkup_rules.json"
+DEFAULT_GROUPED_CHECKUP_RULES_FILE = RULES_BASE / "grouped_checkup_rules.json"
 # Uses the same health checkup XSD as individual CDA generation
-DEFAULT_GROUPED_CHECKUP_XSD_FILE = os.path.join(XSD_OFFICIAL_BASE, "hc08_V08.xsd")
-DEFAULT_GROUPED_CHECKUP_OUTPUT_DIR = "data/output_xmls/cda_checkup_grouped/"
+DEFAULT_GROUPED_CHECKUP_XSD_FILE = XSD_OFFICIAL_BASE / "hc08_V08.xsd"
+DEFAULT_GROUPED_CHECKUP_OUTPUT_DIR = OUTPUT_XMLS_BASE / "cda_checkup_grouped"
 DEFAULT_GROUPED_CHECKUP_FILE_PREFIX = "hc_grp_cda_"
-DEFAULT_ARCHIVE_OUTPUT_DIR = "data/output_archives/"
+DEFAULT_ARCHIVE_OUTPUT_DIR = PurePosixPath("data/output_archives")
+
+
+# Output directories already created by this process; lets repeated
+# main() invocations (tests, sample runs) skip the mkdir syscalls.
+_CREATED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create ``path`` (and parents) once per process."""
+    if path in _CREATED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+def __getattr__(name):
+    # Lazily expose the Orchestrator class so that importing this module
+    # (e.g. for parse_args or --help) does not pull in lxml and the full
+    # conversion stack. Tests may still patch ``main.Orchestrator``.
+    if name == "Orchestrator":
+        from csv_to_xml_converter.orchestrator import Orchestrator
+
+        return Orchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
@@ -131,14 +156,152 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="When used with --sample-test, skip the normal conversion workflow.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Number of worker processes used to convert input CSV files in "
+            "parallel. The default of 1 keeps the sequential path for easier "
+            "debugging."
+        ),
+    )
+    parser.add_argument(
+        "--archive-compression",
+        choices=["deflate", "stored", "zstd"],
+        help=(
+            "Compression method for the submission archive. Overrides the "
+            "'archive.compression' config value; 'stored' skips compression "
+            "entirely."
+        ),
+    )
+    parser.add_argument(
+        "--archive-compresslevel",
+        type=int,
+        metavar="N",
+        help=(
+            "DEFLATE level for the submission archive (1-9). Overrides the "
+            "'archive.compresslevel' config value; the default of 1 trades a "
+            "few percent of size for much faster archiving of XML."
+        ),
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of CSV files handed to each worker at a time when --jobs > 1.",
+    )
     # Removed --csv-to-json option; this functionality is no longer exposed via the CLI
     return parser.parse_args(args)
 
 
+def _run_csv_stages(orchestrator, csv_path, profile, main_logger):
+    """Run every conversion stage for one CSV and return (data, claims) paths.
+
+    The five stages read the same CSV but write their XML to disjoint
+    output directories, and the shared parsed-records sidecar is written
+    exactly once (guarded inside the orchestrator), so they are submitted
+    to a thread pool and only joined at the end.  lxml releases the GIL
+    while serialising and validating, which lets XSD validation and disk
+    writes overlap.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    main_logger.info("Processing CSV: %s", csv_path)
+    main_logger.info("--- Grouped Checkup CDA for %s (profile: %s) ---", csv_path.name, profile)
+
+    # (method, rules file, XSD, output dir, prefix, destination list key)
+    stages = [
+        (
+            orchestrator.process_csv_to_health_checkup_cdas,
+            DEFAULT_CDA_FULL_RULES_FILE,
+            DEFAULT_CDA_FULL_XSD_FILE,
+            DEFAULT_CDA_FULL_OUTPUT_DIR,
+            DEFAULT_CDA_FULL_FILE_PREFIX,
+            "data",
+        ),
+        (
+            orchestrator.process_csv_to_health_guidance_cdas,
+            DEFAULT_HG_CDA_FULL_RULES_FILE,
+            DEFAULT_HG_CDA_XSD_FILE,
+            DEFAULT_HG_CDA_FULL_OUTPUT_DIR,
+            DEFAULT_HG_CDA_FILE_PREFIX,
+            "data",
+        ),
+        (
+            orchestrator.process_csv_to_checkup_settlement_xmls,
+            DEFAULT_CS_RULES_FILE,
+            DEFAULT_CS_XSD_FILE,
+            DEFAULT_CS_OUTPUT_DIR,
+            DEFAULT_CS_FILE_PREFIX,
+            "claims",
+        ),
+        (
+            orchestrator.process_csv_to_guidance_settlement_xmls,
+            DEFAULT_GS_RULES_FILE,
+            DEFAULT_GS_XSD_FILE,
+            DEFAULT_GS_OUTPUT_DIR,
+            DEFAULT_GS_FILE_PREFIX,
+            "claims",
+        ),
+        (
+            orchestrator.process_csv_to_health_checkup_cdas,
+            DEFAULT_GROUPED_CHECKUP_RULES_FILE,
+            DEFAULT_GROUPED_CHECKUP_XSD_FILE,
+            DEFAULT_GROUPED_CHECKUP_OUTPUT_DIR,
+            DEFAULT_GROUPED_CHECKUP_FILE_PREFIX,
+            "data",
+        ),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+        futures = [
+            pool.submit(method, str(csv_path), rules, xsd, out_dir, prefix, profile)
+            for method, rules, xsd, out_dir, prefix, _dest in stages
+        ]
+        # Join in submission order so output lists stay deterministic.
+        results = [future.result() for future in futures]
+
+    data_xml_files = []
+    claims_xml_files = []
+    for (_method, _rules, _xsd, _out_dir, _prefix, dest), generated in zip(stages, results):
+        (data_xml_files if dest == "data" else claims_xml_files).extend(generated)
+
+    grouped_cda_files = results[-1]
+    if grouped_cda_files:
+        main_logger.info("OK: Generated %s Grouped Checkup CDA XML(s).", len(grouped_cda_files))
+    else:
+        main_logger.error("FAIL: Grouped Checkup CDA generation.")
+
+    return data_xml_files, claims_xml_files
+
+
+def _process_one_csv(csv_path_str, profile, app_config):
+    """Convert one CSV file in a worker process spawned for ``--jobs``.
+
+    A fresh ``Orchestrator`` is built from the (picklable) configuration
+    because orchestrator instances hold lxml state that cannot cross
+    process boundaries.
+    """
+
+    from csv_to_xml_converter.orchestrator import Orchestrator
+
+    worker_logger = logging.getLogger(__name__)
+    orchestrator = Orchestrator(app_config)
+    return _run_csv_stages(orchestrator, Path(csv_path_str), profile, worker_logger)
+
+
 def main(cli_args=None):
     """Run conversion workflow using provided CLI arguments."""
 
     cli = parse_args(cli_args)
+
+    from csv_to_xml_converter.config import load_config
+    from csv_to_xml_converter.logger import setup_logger
+
     config_path = cli.config
     app_config = {}
     main_logger = None
@@ -150,12 +313,24 @@ def main(cli_args=None):
     if cli.log_level:
         app_config.setdefault("logging", {})["log_level"] = cli.log_level
     app_config["_config_file_path_"] = config_path
+    # Archive options travel through the config so the orchestrator call
+    # sites keep their existing signatures.
+    if cli.archive_compression:
+        app_config.setdefault("archive", {})["compression"] = cli.archive_compression
+    if cli.archive_compresslevel is not None:
+        app_config.setdefault("archive", {})["compresslevel"] = cli.archive_compresslevel
     main_logger = setup_logger(config=app_config)
     main_logger.info("Application starting - Grouped CDA Test Run...")
 
+    # Resolve the configured paths once; they are consulted several times
+    # below.
+    paths = app_config.get("paths", {})
+    output_xmls_dir = paths.get("output_xmls", "data/output_xmls")
+    csv_input_dir = paths.get("input_csvs", "data/input_csvs")
+
     # Legacy CSV to JSON functionality has been removed
     output_dirs = [
-        app_config.get("paths", {}).get("output_xmls", "data/output_xmls"),
+        output_xmls_dir,
         DEFAULT_CDA_FULL_OUTPUT_DIR,
         DEFAULT_HG_CDA_FULL_OUTPUT_DIR,
         DEFAULT_CS_OUTPUT_DIR,
@@ -163,10 +338,33 @@ def main(cli_args=None):
         DEFAULT_GROUPED_CHECKUP_OUTPUT_DIR,
         DEFAULT_ARCHIVE_OUTPUT_DIR,
     ]
-    # Create output directories
-    for d_str in output_dirs:
-        Path(d_str).mkdir(parents=True, exist_ok=True)
-    orchestrator = Orchestrator(app_config)
+    # Create output directories in one deduplicated sweep
+    for d_str in dict.fromkeys(os.fspath(d) for d in output_dirs):
+        _ensure_dir(d_str)
+    orchestrator_cls = globals().get("Orchestrator")
+    if orchestrator_cls is None:
+        from csv_to_xml_converter.orchestrator import Orchestrator as orchestrator_cls
+    orchestrator = orchestrator_cls(app_config)
+    # Warm the rule and schema caches up front; guarded because tests
+    # substitute lightweight orchestrator stand-ins.
+    if hasattr(orchestrator, "prewarm"):
+        orchestrator.prewarm(
+            rules_files=(
+                DEFAULT_CDA_FULL_RULES_FILE,
+                DEFAULT_HG_CDA_FULL_RULES_FILE,
+                DEFAULT_CS_RULES_FILE,
+                DEFAULT_GS_RULES_FILE,
+                DEFAULT_GROUPED_CHECKUP_RULES_FILE,
+            ),
+            xsd_files=(
+                DEFAULT_CDA_FULL_XSD_FILE,
+                DEFAULT_HG_CDA_XSD_FILE,
+                DEFAULT_CS_XSD_FILE,
+                DEFAULT_GS_XSD_FILE,
+                DEFAULT_INDEX_XSD_FILE,
+                DEFAULT_SUMMARY_XSD_FILE,
+            ),
+        )
 
     if cli.sample_test:
         from sample_test_mode import convert_first_csvs
@@ -177,128 +375,121 @@ def main(cli_args=None):
             "3610123808",
             "40歳未満健診CSV",
         ]
-        out_dir = app_config.get("paths", {}).get("output_xmls", "data/output_xmls")
         convert_first_csvs(
             test_dirs,
-            os.path.join(out_dir, "sample_test"),
+            os.path.join(output_xmls_dir, "sample_test"),
             num_files=cli.sample_num_files,
         )
         if cli.sample_only:
             main_logger.info("Sample test complete; exiting as --sample-only was provided.")
             return
 
-    # Initialize lists for collecting generated XML file paths
-    all_data_xml_files = []
-    all_claims_xml_files = []
-
-    csv_input_dir = app_config.get("paths", {}).get("input_csvs", "data/input_csvs")
-    csv_paths = sorted(Path(csv_input_dir).glob("*.csv"))
+    # os.scandir avoids building Path objects for entries that are
+    # filtered out; only the selected names are materialized below.
+    try:
+        with os.scandir(csv_input_dir) as entries:
+            csv_names = sorted(
+                e.name
+                for e in entries
+                if e.name.endswith(".csv") and not e.name.startswith(".")
+            )
+    except OSError:
+        csv_names = []
+    csv_paths = [Path(csv_input_dir) / name for name in csv_names]
     if not csv_paths:
-        main_logger.warning(f"No CSV files found in {csv_input_dir}")
-
-    for csv_path in csv_paths:
-        main_logger.info(f"Processing CSV: {csv_path}")
-
-        ghcf = orchestrator.process_csv_to_health_checkup_cdas(
-            str(csv_path),
-            DEFAULT_CDA_FULL_RULES_FILE,
-            DEFAULT_CDA_FULL_XSD_FILE,
-            DEFAULT_CDA_FULL_OUTPUT_DIR,
-            DEFAULT_CDA_FULL_FILE_PREFIX,
-            cli.profile,
-        )
-        all_data_xml_files.extend(ghcf)
-
-        ghgf = orchestrator.process_csv_to_health_guidance_cdas(
-            str(csv_path),
-            DEFAULT_HG_CDA_FULL_RULES_FILE,
-            DEFAULT_HG_CDA_XSD_FILE,
-            DEFAULT_HG_CDA_FULL_OUTPUT_DIR,
-            DEFAULT_HG_CDA_FILE_PREFIX,
-            cli.profile,
-        )
-        all_data_xml_files.extend(ghgf)
-
-        gcsf = orchestrator.process_csv_to_checkup_settlement_xmls(
-            str(csv_path),
-            DEFAULT_CS_RULES_FILE,
-            DEFAULT_CS_XSD_FILE,
-            DEFAULT_CS_OUTPUT_DIR,
-            DEFAULT_CS_FILE_PREFIX,
-            cli.profile,
-        )
-        all_claims_xml_files.extend(gcsf)
+        main_logger.warning("No CSV files found in %s", csv_input_dir)
+
+    jobs = max(cli.jobs or 1, 1)
+    if jobs > 1 and len(csv_paths) > 1:
+        # CPU-bound XML generation scales with processes rather than
+        # threads; each worker rebuilds its orchestrator from the config.
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        worker = partial(_process_one_csv, profile=cli.profile, app_config=app_config)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(csv_paths))) as pool:
+            csv_results = list(
+                pool.map(
+                    worker,
+                    (str(p) for p in csv_paths),
+                    chunksize=max(cli.chunksize or 1, 1),
+                )
+            )
+    else:
+        csv_results = [
+            _run_csv_stages(orchestrator, csv_path, cli.profile, main_logger)
+            for csv_path in csv_paths
+        ]
 
-        ggsf = orchestrator.process_csv_to_guidance_settlement_xmls(
-            str(csv_path),
-            DEFAULT_GS_RULES_FILE,
-            DEFAULT_GS_XSD_FILE,
-            DEFAULT_GS_OUTPUT_DIR,
-            DEFAULT_GS_FILE_PREFIX,
-            cli.profile,
-        )
-        all_claims_xml_files.extend(ggsf)
+    # Flatten the per-CSV results in one pass each; the lists are reused by
+    # the index, summary and archive stages below.
+    from itertools import chain
 
-        main_logger.info(
-            f"--- Grouped Checkup CDA for {csv_path.name} (profile: {cli.profile}) ---"
-        )
-        grouped_cda_files = orchestrator.process_csv_to_health_checkup_cdas(
-            str(csv_path),
-            DEFAULT_GROUPED_CHECKUP_RULES_FILE,
-            DEFAULT_GROUPED_CHECKUP_XSD_FILE,
-            DEFAULT_GROUPED_CHECKUP_OUTPUT_DIR,
-            DEFAULT_GROUPED_CHECKUP_FILE_PREFIX,
-            cli.profile,
-        )
-        all_data_xml_files.extend(grouped_cda_files)
-        if grouped_cda_files:
-            main_logger.info(
-                f"OK: Generated {len(grouped_cda_files)} Grouped Checkup CDA XML(s)."
-            )
-        else:
-            main_logger.error("FAIL: Grouped Checkup CDA generation.")
+    all_data_xml_files = list(chain.from_iterable(data for data, _claims in csv_results))
+    all_claims_xml_files = list(chain.from_iterable(claims for _data, claims in csv_results))
 
     # --- Generate Aggregated Index and Summary XMLs ---
-    main_logger.info(f"--- Generating Aggregated Index and Summary XMLs ---")
+    main_logger.info("--- Generating Aggregated Index and Summary XMLs ---")
     index_xml_generated_path = None
     summary_xml_generated_path = None
 
-    if orchestrator.generate_aggregated_index_xml(
-        all_data_xml_files,
-        all_claims_xml_files,
-        DEFAULT_INDEX_OUTPUT_XML,
-        DEFAULT_INDEX_XSD_FILE,
-    ):
-        index_xml_generated_path = DEFAULT_INDEX_OUTPUT_XML
-        main_logger.info(
-            f"OK: Aggregated Index XML generated: {index_xml_generated_path}"
+    # Index and summary only need the collected file lists, so the two
+    # aggregation stages can overlap instead of running back to back.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as agg_pool:
+        index_future = agg_pool.submit(
+            orchestrator.generate_aggregated_index_xml,
+            all_data_xml_files,
+            all_claims_xml_files,
+            DEFAULT_INDEX_OUTPUT_XML,
+            DEFAULT_INDEX_XSD_FILE,
+        )
+        summary_future = agg_pool.submit(
+            orchestrator.generate_aggregated_summary_xml,
+            all_claims_xml_files,
+            all_data_xml_files,
+            DEFAULT_SUMMARY_OUTPUT_XML,
+            DEFAULT_SUMMARY_XSD_FILE,
         )
+
+    if index_future.result():
+        index_xml_generated_path = DEFAULT_INDEX_OUTPUT_XML
+        main_logger.info("OK: Aggregated Index XML generated: %s", index_xml_generated_path)
     else:
-        main_logger.error(f"FAIL: Aggregated Index XML generation.")
+        main_logger.error("FAIL: Aggregated Index XML generation.")
 
-    if orchestrator.generate_aggregated_summary_xml(
-        all_claims_xml_files,
-        all_data_xml_files,
-        DEFAULT_SUMMARY_OUTPUT_XML,
-        DEFAULT_SUMMARY_XSD_FILE,
-    ):
+    if summary_future.result():
         summary_xml_generated_path = DEFAULT_SUMMARY_OUTPUT_XML
-        main_logger.info(
-            "OK: Aggregated Summary XML generated: "
-            f"{summary_xml_generated_path}"
-        )
+        main_logger.info("OK: Aggregated Summary XML generated: %s", summary_xml_generated_path)
     else:
-        main_logger.error(f"FAIL: Aggregated Summary XML generation.")
+        main_logger.error("FAIL: Aggregated Summary XML generation.")
 
-    main_logger.info(f"--- Archiving Process ---")
+    main_logger.info("--- Archiving Process ---")
     # Use all_data_xml_files and all_claims_xml_files collected above
     if (
         index_xml_generated_path
         and summary_xml_generated_path
         and (all_data_xml_files or all_claims_xml_files)
     ):
+        import time
+
+        # time.strftime formats without building a datetime object, and
+        # SOURCE_DATE_EPOCH (if set) makes archive names reproducible.
+        source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        try:
+            time_tuple = (
+                time.gmtime(int(source_date_epoch))
+                if source_date_epoch
+                else time.localtime()
+            )
+        except (ValueError, OverflowError):
+            main_logger.warning(
+                "Ignoring invalid SOURCE_DATE_EPOCH value: %r", source_date_epoch
+            )
+            time_tuple = time.localtime()
         archive_base = (
-            f"Submission_Aggregated_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            f"Submission_Aggregated_{time.strftime('%Y%m%d%H%M%S', time_tuple)}"
         )
         zip_path = orchestrator.create_submission_archive(
             index_xml_generated_path, summary_xml_generated_path,
@@ -306,20 +497,14 @@ def main(cli_args=None):
             archive_base, DEFAULT_ARCHIVE_OUTPUT_DIR
         )
         if zip_path:
-            main_logger.info(f"OK: Archive created: {zip_path}")
+            main_logger.info("OK: Archive created: %s", zip_path)
             # Add verification step
             if orchestrator.verify_archive_contents(zip_path):
-                main_logger.info(
-                    "OK: Archive contents successfully verified: "
-                    f"{zip_path}"
-                )
+                main_logger.info("OK: Archive contents successfully verified: %s", zip_path)
             else:
-                main_logger.error(
-                    "FAIL: Archive contents verification failed for: "
-                    f"{zip_path}"
-                )
+                main_logger.error("FAIL: Archive contents verification failed for: %s", zip_path)
         else:
-            main_logger.error(f"FAIL: Archive creation.")
+            main_logger.error("FAIL: Archive creation.")
     else:
         main_logger.warning(
             "Skipping archiving: missing critical aggregated XMLs or "
@@ -1,31 +1,73 @@
 """Utilities for sample data conversion test mode."""
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 from lxml import etree
 import re
 
-from csv_to_xml_converter.csv_parser import parse_csv
+from csv_to_xml_converter.csv_parser import parse_csv_rows
 
+# Maps every ASCII character that is invalid in an XML tag name to "_".
+# str.translate runs in C and avoids regex dispatch on the hot path;
+# non-ASCII tags fall back to the regex.
+_TAG_TRANSLATE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "_.-")}
+)
+_TAG_INVALID_RE = re.compile(r"[^a-zA-Z0-9_.-]")
 
+
+@lru_cache(maxsize=4096)
 def _sanitize_tag(tag: str) -> str:
     """Return a tag name safe for XML creation."""
     # Replace characters invalid in XML tag names with underscores
-    sanitized = re.sub(r"[^a-zA-Z0-9_.-]", "_", tag)
+    if tag.isascii():
+        sanitized = tag.translate(_TAG_TRANSLATE)
+    else:
+        sanitized = _TAG_INVALID_RE.sub("_", tag)
     # Tag names cannot start with digits or punctuation
     if not sanitized or not sanitized[0].isalpha() and sanitized[0] not in "_":
         sanitized = f"_{sanitized}"
     return sanitized
 
 
-def _csv_to_xml(records: List[dict]) -> str:
-    root = etree.Element("records")
-    for rec in records:
-        r_el = etree.SubElement(root, "record")
-        for k, v in rec.items():
-            safe_tag = _sanitize_tag(k)
-            child = etree.SubElement(r_el, safe_tag)
-            child.text = v
-    return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-8").decode("utf-8")
+def _make_record_writer(fieldnames: Iterable[str]):
+    """Return an emitter specialized to one CSV's column set.
+
+    The sanitized tags are resolved once from the header, so writing each
+    row is a straight positional loop with no per-cell sanitization or
+    key lookups.
+    """
+    tags = [_sanitize_tag(k) for k in fieldnames]
+
+    def write_record(xf, row: List[str]) -> None:
+        r_el = etree.Element("record")
+        for tag, value in zip(tags, row):
+            child = etree.SubElement(r_el, tag)
+            child.text = value
+        xf.write(r_el)
+
+    return write_record
+
+
+def _write_csv_to_xml(
+    header: Optional[List[str]], rows: Iterable[List[str]], xml_file: Path
+) -> None:
+    """Serialize positional ``rows`` under ``header`` to ``xml_file``.
+
+    Rows are written one at a time through ``etree.xmlfile`` so memory
+    stays bounded by a single record instead of the whole document tree.
+    """
+    with etree.xmlfile(str(xml_file), encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("records"):
+            if header is None:
+                return
+            write_record = _make_record_writer(header)
+            for row in rows:
+                write_record(xf, row)
 
 
 def convert_first_csvs(
@@ -48,19 +90,45 @@ def convert_first_csvs(
     output_paths: List[str] = []
     out_path = Path(output_dir)
     out_path.mkdir(parents=True, exist_ok=True)
-    for d in directories:
-        dir_path = Path(d)
-        if not dir_path.is_dir():
-            continue
-        csv_files = sorted(dir_path.glob("*.csv"))[:num_files]
-        for idx, csv_path in enumerate(csv_files, start=1):
-            try:
-                records = parse_csv(str(csv_path), encoding="shift_jis")
-            except Exception:
-                records = []
-            xml_str = _csv_to_xml(records)
-            suffix = f"_{idx}" if num_files > 1 else ""
-            xml_file = out_path / f"{dir_path.name}{suffix}.xml"
-            xml_file.write_text(xml_str, encoding="utf-8")
-            output_paths.append(str(xml_file))
+    dir_paths = [Path(d) for d in directories]
+    if not dir_paths:
+        return output_paths
+    # Each directory is independent, so they are converted concurrently.
+    # ``map`` keeps the results in directory order.
+    with ThreadPoolExecutor(max_workers=len(dir_paths)) as pool:
+        for paths in pool.map(
+            lambda d: _convert_dir(d, out_path, num_files), dir_paths
+        ):
+            output_paths.extend(paths)
+    return output_paths
+
+
+def _convert_dir(dir_path: Path, out_path: Path, num_files: int) -> List[str]:
+    """Convert the first ``num_files`` CSVs of one directory into XML files."""
+    output_paths: List[str] = []
+    if not dir_path.is_dir():
+        return output_paths
+    # Scan names only; nsmallest picks the first N alphabetically in
+    # O(n log k) instead of fully sorting the directory listing.
+    with os.scandir(dir_path) as entries:
+        csv_names = heapq.nsmallest(
+            num_files,
+            (
+                e.name
+                for e in entries
+                if e.name.endswith(".csv") and not e.name.startswith(".")
+            ),
+        )
+    csv_files = [dir_path / name for name in csv_names]
+    for idx, csv_path in enumerate(csv_files, start=1):
+        suffix = f"_{idx}" if num_files > 1 else ""
+        xml_file = out_path / f"{dir_path.name}{suffix}.xml"
+        try:
+            rows = parse_csv_rows(str(csv_path), encoding="shift_jis")
+            _write_csv_to_xml(next(rows, None), rows, xml_file)
+        except Exception:
+            # Mirror the old behaviour: unparsable CSVs still produce an
+            # (empty) XML document rather than aborting the sample run.
+            _write_csv_to_xml(None, (), xml_file)
+        output_paths.append(str(xml_file))
     return output_paths
@@ -1,7 +1,157 @@
 import sys
 from pathlib import Path
 
+import pytest
+from lxml import etree
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+XSD_DIR = ROOT / "XSD"
+
+
+def _compile_schema(xsd_name: str) -> etree.XMLSchema:
+    return etree.XMLSchema(etree.parse(str(XSD_DIR / xsd_name)))
+
+
+@pytest.fixture(scope="session")
+def ix08_schema() -> etree.XMLSchema:
+    """Compiled index schema, built once per session."""
+    return _compile_schema("ix08_V08.xsd")
+
+
+# Shared rule-engine test models. Building a dataclass runs the full
+# field-resolution machinery, so classes used by several cases are created
+# once per session and handed to tests as fixtures.
+
+
+@pytest.fixture(scope="session")
+def er_test_data():
+    """Entry-relationship CDA input shared across generator tests.
+
+    Session-scoped and returned as-is; tests must treat it as read-only
+    and deep-copy before mutating.
+    """
+    return {
+        "documentIdExtension": "ER_TEST_DOC",
+        "documentEffectiveTime": "20230101",
+        "typeIdRootOid": "2.16.840.1.113883.1.3",
+        "typeIdExtension": "POCD_HD000040",
+        "documentTypeCode": "10",
+        "documentTypeCodeSystem": "1.2.392.200119.6.1001",
+        "documentTypeDisplayName": "特定健診情報",
+        "documentIdRootOid": "1.2.3.4.5.6.7",
+        "section_ResultsCode": "RESULTS_SECTION",
+        "section_ResultsCodeSystem": "LOCAL_SYS",
+        "section_ResultsTitle": "検査結果セクション",
+        "examination_results_er_group": [
+            {
+                "parent_obs_data": {
+                    "code": "PANEL_ANEMIA",
+                    "codeSystem": "LOCAL_CODES",
+                    "displayName": "貧血検査パネル",
+                    "classCode": "CLUSTER",
+                },
+                "entry_relationship_typeCode": "COMP",
+                "components": [
+                    {"code": "HGB", "codeSystem": "JLAC10", "displayName": "ヘモグロビン", "value": "10.5", "unit": "g/dL", "value_type": "PQ"},
+                    {"code": "RBC", "codeSystem": "JLAC10", "displayName": "赤血球数", "value": "350", "unit": "x10E4/uL", "value_type": "PQ"},
+                ],
+            }
+        ],
+        "item_heightCode": "HGT_C",
+        "item_heightCodeSystem": "SYS_H",
+        "item_heightDisplayName": "Height",
+        "item_height_value": "175",
+        "item_height_unit": "cm",
+    }
+
+
+@pytest.fixture(scope="session")
+def er_model_cls():
+    """Model with an entry-relationship anchor list."""
+    from dataclasses import dataclass, field
+    from typing import Any, Dict, List, Optional
+
+    from csv_to_xml_converter.models import IntermediateRecord
+
+    @dataclass
+    class TestERModel(IntermediateRecord):
+        anemia_panel_results: List[Dict[str, Any]] = field(default_factory=list)
+        hgb_value_direct: Optional[str] = None
+        rbc_value_direct: Optional[str] = None
+
+    return TestERModel
+
+
+@pytest.fixture(scope="session")
+def calc_model_cls():
+    """Model with a nested observation for calculate/nested-path rules."""
+    from dataclasses import dataclass
+    from typing import Any, Optional
+
+    from csv_to_xml_converter.models import IntermediateRecord
+
+    @dataclass
+    class NestedObservation:
+        value: Optional[Any] = None
+        unit: Optional[str] = None
+
+    @dataclass
+    class TestCalcModel(IntermediateRecord):
+        bmi_observation: Optional[NestedObservation] = None
+        height_cm: Optional[float] = None
+
+        def __post_init__(self):
+            if hasattr(super(), "__post_init__"):
+                super().__post_init__()
+            if self.bmi_observation is None:
+                self.bmi_observation = NestedObservation()
+
+    return TestCalcModel
+
+
+@pytest.fixture(scope="session")
+def index_model_cls():
+    """Model matching the fields produced by config_rules/index_rules.json."""
+    from dataclasses import dataclass
+    from typing import Optional
+
+    from csv_to_xml_converter.models import IntermediateRecord
+
+    @dataclass
+    class IndexModel(IntermediateRecord):
+        interactionType: Optional[str] = None
+        creationTime: Optional[str] = None
+        senderIdRootOid: Optional[str] = None
+        senderIdExtension: Optional[str] = None
+        receiverIdRootOid: Optional[str] = None
+        receiverIdExtension: Optional[str] = None
+        serviceEventType: Optional[str] = None
+        totalRecordCount: Optional[int] = None
+
+    return IndexModel
+
+
+@pytest.fixture(scope="session")
+def summary_model_cls():
+    """Model matching the fields produced by config_rules/summary_rules.json."""
+    from dataclasses import dataclass
+    from typing import Optional
+
+    from csv_to_xml_converter.models import IntermediateRecord
+
+    @dataclass
+    class SummaryModel(IntermediateRecord):
+        serviceEventTypeCode: Optional[str] = None
+        serviceEventTypeCodeSystem: Optional[str] = None
+        serviceEventTypeDisplayName: Optional[str] = None
+        totalSubjectCount_value: Optional[int] = None
+        totalCostAmount_value: Optional[int] = None
+        totalCostAmount_currency: Optional[str] = None
+        totalClaimAmount_value: Optional[int] = None
+        totalClaimAmount_currency: Optional[str] = None
+
+    return SummaryModel
@@ -1,148 +1,132 @@
 import pytest
-import os
-import logging
 from csv_to_xml_converter.csv_parser import parse_csv, parse_csv_from_profile, CSVParsingError
 
 
-def test_csv_parser(tmp_path):
-    logging.basicConfig(level=logging.DEBUG)
-    # Prepare CSV files
-    csv_content_basic = "name,age,city\nAlice,30,New York\nBob,25,Los Angeles"
-    csv_path_basic = tmp_path / "basic.csv"
-    csv_path_basic.write_text(csv_content_basic, encoding="utf-8")
-
-    csv_content_tab = "name\tage\tcity\nCarol\t40\tChicago\nDave\t35\tHouston"
-    csv_path_tab = tmp_path / "tab.csv"
-    csv_path_tab.write_text(csv_content_tab, encoding="utf-8")
-
-    sjis_name = "名前".encode('shift_jis').decode('shift_jis')
-    sjis_age = "年齢".encode('shift_jis').decode('shift_jis')
-    sjis_city = "都市".encode('shift_jis').decode('shift_jis')
-    sjis_data_row1_name = "山田太郎".encode('shift_jis').decode('shift_jis')
-    sjis_data_row1_age = "45".encode('shift_jis').decode('shift_jis')
-    sjis_data_row1_city = "東京".encode('shift_jis').decode('shift_jis')
-    csv_content_sjis = f"{sjis_name},{sjis_age},{sjis_city}\n{sjis_data_row1_name},{sjis_data_row1_age},{sjis_data_row1_city}"
-    csv_path_sjis = tmp_path / "sjis.csv"
-    csv_path_sjis.write_text(csv_content_sjis, encoding="shift_jis")
-
-    csv_content_missing_col = "name,city\nEve,50,Miami"
-    csv_path_missing_col = tmp_path / "missing.csv"
-    csv_path_missing_col.write_text(csv_content_missing_col, encoding="utf-8")
-
-    csv_content_comments = """# comment\nname,value\n# c2\n\nitemA,100\n\nitemB,200\n# end"""
-    csv_path_comments = tmp_path / "comments.csv"
-    csv_path_comments.write_text(csv_content_comments, encoding="utf-8")
-
-    csv_content_quotes = 'name,notes\n"Smith, John","He said ""Hi"""\nJane,""Hello""'
-    csv_path_quotes = tmp_path / "quotes.csv"
-    csv_path_quotes.write_text(csv_content_quotes, encoding="utf-8")
-
-    csv_content_single_quote = "name,desc\n'Alice','goodbye, friend'"
-    csv_path_single_quote = tmp_path / "single.csv"
-    csv_path_single_quote.write_text(csv_content_single_quote, encoding="utf-8")
-
-    csv_content_escape = 'name\n"A\\"lice"'
-    csv_path_escape = tmp_path / "escape.csv"
-    csv_path_escape.write_text(csv_content_escape, encoding="utf-8")
-
-    records1 = parse_csv(str(csv_path_basic))
-    assert len(records1) == 2
-    assert records1[0] == {"name": "Alice", "age": "30", "city": "New York"}
-
-    records2 = parse_csv(str(csv_path_tab), delimiter="\t")
-    assert records2[0] == {"name": "Carol", "age": "40", "city": "Chicago"}
+# Fixture CSVs are written once per session (see csv_dir below) instead of
+# per test, so the parse cases can run as independent parametrised tests.
+_FIXTURE_FILES = {
+    "basic.csv": ("name,age,city\nAlice,30,New York\nBob,25,Los Angeles", "utf-8"),
+    "tab.csv": ("name\tage\tcity\nCarol\t40\tChicago\nDave\t35\tHouston", "utf-8"),
+    "sjis.csv": ("名前,年齢,都市\n山田太郎,45,東京", "shift_jis"),
+    "missing.csv": ("name,city\nEve,50,Miami", "utf-8"),
+    "comments.csv": ("# comment\nname,value\n# c2\n\nitemA,100\n\nitemB,200\n# end", "utf-8"),
+    "quotes.csv": ('name,notes\n"Smith, John","He said ""Hi"""\nJane,""Hello""', "utf-8"),
+    "single.csv": ("name,desc\n'Alice','goodbye, friend'", "utf-8"),
+    "escape.csv": ('name\n"A\\"lice"', "utf-8"),
+    "no_header.csv": ("valA1,valB1\nvalA2,valB2", "utf-8"),
+    "no_header_req.csv": ("valX,valY\nvalZ,valW", "utf-8"),
+    "no_header_quotes.csv": ('"v1","v2"\n"v3","v4"', "utf-8"),
+    "bom.csv": ("名前,年齢\n山田太郎,45", "utf-8-sig"),
+}
+
+
+@pytest.fixture(scope="session")
+def csv_dir(tmp_path_factory):
+    """Materialise every fixture CSV once for the whole test session."""
+    directory = tmp_path_factory.mktemp("csvs")
+    for name, (content, encoding) in _FIXTURE_FILES.items():
+        (directory / name).write_text(content, encoding=encoding)
+    return directory
+
+
+PARSE_CSV_CASES = [
+    ("basic.csv", {}, 2, 0, {"name": "Alice", "age": "30", "city": "New York"}),
+    ("tab.csv", {"delimiter": "\t"}, 2, 0, {"name": "Carol", "age": "40", "city": "Chicago"}),
+    ("sjis.csv", {"encoding": "shift_jis"}, 1, 0, {"名前": "山田太郎", "年齢": "45", "都市": "東京"}),
+    ("comments.csv", {}, 2, 1, {"name": "itemB", "value": "200"}),
+    ("quotes.csv", {}, 2, 0, {"name": "Smith, John", "notes": 'He said "Hi"'}),
+    ("single.csv", {"quotechar": "'"}, 1, 0, {"name": "Alice", "desc": "goodbye, friend"}),
+    ("escape.csv", {"escapechar": "\\", "doublequote": False}, 1, 0, {"name": 'A"lice'}),
+    # UTF-8 BOM file should decode correctly even with wrong encoding
+    # specified; the non-ASCII content would fail a real shift_jis decode.
+    ("bom.csv", {"encoding": "shift_jis"}, 1, 0, {"名前": "山田太郎", "年齢": "45"}),
+]
+
+
+@pytest.mark.parametrize(
+    "csv_name,kwargs,expected_len,check_idx,expected_record", PARSE_CSV_CASES
+)
+def test_parse_csv_files(csv_dir, csv_name, kwargs, expected_len, check_idx, expected_record):
+    records = parse_csv(str(csv_dir / csv_name), **kwargs)
+    assert len(records) == expected_len
+    assert records[check_idx] == expected_record
+
+
+def test_parse_csv_missing_required_column(csv_dir):
+    with pytest.raises(CSVParsingError):
+        parse_csv(str(csv_dir / "missing.csv"), required_columns=["name", "age", "city"])
 
-    records3 = parse_csv(str(csv_path_sjis), encoding="shift_jis")
-    assert records3[0][sjis_name] == sjis_data_row1_name
 
-    with pytest.raises(CSVParsingError):
-        parse_csv(str(csv_path_missing_col), required_columns=["name", "age", "city"])
+def test_parse_csv_string_source():
+    records = parse_csv("name,age,city\nAlice,30,New York\nBob,25,Los Angeles")
+    assert records[0]["name"] == "Alice"
 
-    records5 = parse_csv(str(csv_path_comments))
-    assert len(records5) == 2
-    assert records5[1] == {"name": "itemB", "value": "200"}
 
-    records6 = parse_csv(csv_content_basic)
-    assert records6[0]["name"] == "Alice"
+def test_parse_csv_file_not_found():
+    with pytest.raises(FileNotFoundError):
+        parse_csv("non_existent_file.csv")
 
-    records_quotes = parse_csv(str(csv_path_quotes))
-    assert records_quotes[0] == {"name": "Smith, John", "notes": "He said \"Hi\""}
 
-    records_single = parse_csv(str(csv_path_single_quote), quotechar="'")
-    assert records_single[0] == {"name": "Alice", "desc": "goodbye, friend"}
+def test_parse_csv_column_count_mismatch():
+    records = parse_csv("header1,header2\ndata1\ndata1,data2,data3")
+    assert len(records) == 0
 
-    records_escape = parse_csv(str(csv_path_escape), escapechar="\\", doublequote=False)
-    assert records_escape[0] == {"name": 'A"lice'}
 
+def test_parse_csv_from_profile(csv_dir):
     profile_test = {
-        "source": str(csv_path_basic),
+        "source": str(csv_dir / "basic.csv"),
         "delimiter": ",",
         "encoding": "utf-8",
         "required_columns": ["name", "age"],
     }
-    records7 = parse_csv_from_profile(profile_test)
-    assert len(records7) == 2
-
-    with pytest.raises(ValueError):
-        parse_csv_from_profile({"delimiter": ","})
+    records = parse_csv_from_profile(profile_test)
+    assert len(records) == 2
+
+
+PROFILE_ERROR_CASES = [
+    ({"delimiter": ","}, ValueError),
+    ({"source": "dummy\n1,2", "has_header": False}, ValueError),
+    (
+        {
+            "source": "dummy\n1,2,3",
+            "has_header": False,
+            "column_names": ["colA", "colB"],
+            "required_columns": ["colA", "colC"],
+        },
+        CSVParsingError,
+    ),
+]
+
+
+@pytest.mark.parametrize("profile,expected_exc", PROFILE_ERROR_CASES)
+def test_parse_csv_from_profile_errors(profile, expected_exc):
+    with pytest.raises(expected_exc):
+        parse_csv_from_profile(profile)
 
-    profile_no_cols = {"source": "dummy\n1,2", "has_header": False}
-    with pytest.raises(ValueError):
-        parse_csv_from_profile(profile_no_cols)
 
-    profile_req_missing = {
-        "source": "dummy\n1,2,3",
-        "has_header": False,
-        "column_names": ["colA", "colB"],
-        "required_columns": ["colA", "colC"],
-    }
-    with pytest.raises(CSVParsingError):
-        parse_csv_from_profile(profile_req_missing)
-
-    csv_path_no_header = tmp_path / "no_header.csv"
-    csv_path_no_header.write_text("valA1,valB1\nvalA2,valB2", encoding="utf-8")
-    profile_valid = {
-        "source": str(csv_path_no_header),
-        "has_header": False,
-        "column_names": ["colA", "colB"],
-        "required_columns": ["colA"],
-    }
-    records8_3 = parse_csv_from_profile(profile_valid)
-    assert records8_3[0] == {"colA": "valA1", "colB": "valB1"}
+PROFILE_NO_HEADER_CASES = [
+    ("no_header.csv", ["colA", "colB"], ["colA"], 0, {"colA": "valA1", "colB": "valB1"}),
+    ("no_header_req.csv", ["headerX", "headerY"], ["headerX"], 1, {"headerX": "valZ", "headerY": "valW"}),
+    ("no_header_quotes.csv", ["col1", "col2"], None, 1, {"col1": "v3", "col2": "v4"}),
+]
 
-    csv_path_no_header_req = tmp_path / "no_header_req.csv"
-    csv_path_no_header_req.write_text("valX,valY\nvalZ,valW", encoding="utf-8")
-    profile_valid_req = {
-        "source": str(csv_path_no_header_req),
-        "has_header": False,
-        "column_names": ["headerX", "headerY"],
-        "required_columns": ["headerX"],
-    }
-    records8_4 = parse_csv_from_profile(profile_valid_req)
-    assert records8_4[1] == {"headerX": "valZ", "headerY": "valW"}
 
-    csv_path_no_header_quotes = tmp_path / "no_header_quotes.csv"
-    csv_path_no_header_quotes.write_text('"v1","v2"\n"v3","v4"', encoding="utf-8")
-    profile_quotes = {
-        "source": str(csv_path_no_header_quotes),
+@pytest.mark.parametrize(
+    "csv_name,column_names,required_columns,check_idx,expected_record",
+    PROFILE_NO_HEADER_CASES,
+)
+def test_parse_csv_from_profile_no_header(
+    csv_dir, csv_name, column_names, required_columns, check_idx, expected_record
+):
+    profile = {
+        "source": str(csv_dir / csv_name),
         "has_header": False,
-        "column_names": ["col1", "col2"],
+        "column_names": column_names,
     }
-    rec_quotes = parse_csv_from_profile(profile_quotes)
-    assert rec_quotes[1] == {"col1": "v3", "col2": "v4"}
-
-    with pytest.raises(FileNotFoundError):
-        parse_csv("non_existent_file.csv")
-
-    csv_content_mismatch = "header1,header2\ndata1\ndata1,data2,data3"
-    records10 = parse_csv(csv_content_mismatch)
-    assert len(records10) == 0
-
-    # UTF-8 BOM file should decode correctly even with wrong encoding specified
-    bom_csv = tmp_path / "bom.csv"
-    bom_csv.write_text("name,age\nAmy,22", encoding="utf-8-sig")
-    records_bom = parse_csv(str(bom_csv), encoding="shift_jis")
-    assert records_bom[0] == {"name": "Amy", "age": "22"}
+    if required_columns:
+        profile["required_columns"] = required_columns
+    records = parse_csv_from_profile(profile)
+    assert records[check_idx] == expected_record
 
 
 def test_parse_csv_from_profile_file_not_found():
@@ -1,16 +1,19 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
+
+import pytest
+
 from csv_to_xml_converter.rule_engine import apply_rules, _set_nested_attr
 from csv_to_xml_converter.models import IntermediateRecord
 
 
-def test_rule_engine_entry_relationship_and_calculate():
-    @dataclass
-    class TestERModel(IntermediateRecord):
-        anemia_panel_results: List[Dict[str, Any]] = field(default_factory=list)
-        hgb_value_direct: Optional[str] = None
-        rbc_value_direct: Optional[str] = None
-
+# Batch sizes exercise the per-row loop as well as per-call setup; a
+# regression that makes rule dispatch scale worse than linearly shows up
+# as a disproportionate slowdown on the larger sizes.
+@pytest.mark.parametrize("n_rows", [1, 100, 1000])
+def test_rule_engine_entry_relationship_and_calculate(
+    er_model_cls, calc_model_cls, n_rows
+):
     mock_lookups_er = {
         "$oid_catalog$": {
             "OID.JLAC10.Hgb": "1001-9",
@@ -51,27 +54,15 @@ def test_rule_engine_entry_relationship_and_calculate():
             ],
         }
     ]
-    er_data = [{"hgb_val_csv": "12.5", "rbc_val_csv": "4.5"}]
-    models = apply_rules(er_data, er_rules, model_class=TestERModel, lookup_tables=mock_lookups_er)
-    assert models[0].anemia_panel_results[0]["entry_relationship_typeCode"] == "COMP"
-
-    @dataclass
-    class NestedObservation:
-        value: Optional[Any] = None
-        unit: Optional[str] = None
-
-    @dataclass
-    class TestCalcModel(IntermediateRecord):
-        bmi_observation: Optional[NestedObservation] = None
-        height_cm: Optional[float] = None
-
-        def __post_init__(self):
-            if hasattr(super(), "__post_init__"):
-                super().__post_init__()
-            if self.bmi_observation is None:
-                self.bmi_observation = NestedObservation()
-
-    test_model_instance = TestCalcModel()
+    er_data = [{"hgb_val_csv": "12.5", "rbc_val_csv": "4.5"} for _ in range(n_rows)]
+    models = apply_rules(er_data, er_rules, model_class=er_model_cls, lookup_tables=mock_lookups_er)
+    assert len(models) == len(er_data)
+    for model in (models[0], models[-1]):
+        assert model.anemia_panel_results[0]["entry_relationship_typeCode"] == "COMP"
+        assert model.anemia_panel_results[0]["components"][0]["displayName"] == "HGB"
+        assert model.anemia_panel_results[0]["components"][1]["displayName"] == "RBC"
+
+    test_model_instance = calc_model_cls()
     _set_nested_attr(test_model_instance, "height_cm", 175.0)
     _set_nested_attr(test_model_instance, "bmi_observation.unit", "kg/m2")
     assert test_model_instance.height_cm == 175.0
@@ -89,11 +80,32 @@ def test_rule_engine_entry_relationship_and_calculate():
         }
     ]
     calc_data = [{"weight_csv": "70", "height_m_csv": "1.75"}]
-    result = apply_rules(calc_data, calc_rules, model_class=TestCalcModel, lookup_tables={})
+    result = apply_rules(calc_data, calc_rules, model_class=calc_model_cls, lookup_tables={})
     expected_bmi = round(70 / (1.75 ** 2), 2)
     assert result[0].bmi_observation.value == expected_bmi
 
 
+def test_set_nested_attr_at_scale(calc_model_cls):
+    """Hammer _set_nested_attr so the memoized path split is exercised.
+
+    Not a timed benchmark, but large enough that a regression in the
+    per-call constant factor (e.g. re-splitting the path every call)
+    shows up in the suite's runtime.
+    """
+    from csv_to_xml_converter.rule_engine import _split_attr_path
+
+    _split_attr_path.cache_clear()
+    models = [calc_model_cls() for _ in range(1000)]
+    for model in models:
+        _set_nested_attr(model, "bmi_observation.unit", "kg/m2")
+        _set_nested_attr(model, "height_cm", 175.0)
+    assert models[0].bmi_observation.unit == "kg/m2"
+    assert models[-1].height_cm == 175.0
+    info = _split_attr_path.cache_info()
+    assert info.misses == 2
+    assert info.hits == 2 * len(models) - 2
+
+
 def test_concat_split_create_and_lookup_loading():
     from csv_to_xml_converter.models import ObservationDataItem
 
@@ -144,40 +156,18 @@ def test_nested_object_creation_and_mapping():
     assert m.nested.value == "10.5"
 
 
-def test_index_and_summary_rules_files():
+def test_index_and_summary_rules_files(index_model_cls, summary_model_cls):
     from csv_to_xml_converter.rule_engine import load_rules
 
-    @dataclass
-    class IndexModel(IntermediateRecord):
-        interactionType: Optional[str] = None
-        creationTime: Optional[str] = None
-        senderIdRootOid: Optional[str] = None
-        senderIdExtension: Optional[str] = None
-        receiverIdRootOid: Optional[str] = None
-        receiverIdExtension: Optional[str] = None
-        serviceEventType: Optional[str] = None
-        totalRecordCount: Optional[int] = None
-
     index_rules = load_rules("config_rules/index_rules.json")
     index_data = [{"creation_date": "20240101", "record_count": "5"}]
-    idx_model = apply_rules(index_data, index_rules, model_class=IndexModel, lookup_tables={})[0]
+    idx_model = apply_rules(index_data, index_rules, model_class=index_model_cls, lookup_tables={})[0]
     assert idx_model.interactionType == "1"
     assert idx_model.totalRecordCount == 5
 
-    @dataclass
-    class SummaryModel(IntermediateRecord):
-        serviceEventTypeCode: Optional[str] = None
-        serviceEventTypeCodeSystem: Optional[str] = None
-        serviceEventTypeDisplayName: Optional[str] = None
-        totalSubjectCount_value: Optional[int] = None
-        totalCostAmount_value: Optional[int] = None
-        totalCostAmount_currency: Optional[str] = None
-        totalClaimAmount_value: Optional[int] = None
-        totalClaimAmount_currency: Optional[str] = None
-
     summary_rules = load_rules("config_rules/summary_rules.json")
     summary_data = [{"total_subjects": "10", "total_cost": "1000", "total_claim": "800"}]
-    sum_model = apply_rules(summary_data, summary_rules, model_class=SummaryModel, lookup_tables={})[0]
+    sum_model = apply_rules(summary_data, summary_rules, model_class=summary_model_cls, lookup_tables={})[0]
     assert sum_model.serviceEventTypeCode == "1"
     assert sum_model.totalSubjectCount_value == 10
     assert sum_model.totalCostAmount_currency == "JPY"
@@ -1,3 +1,4 @@
+import io
 import os
 from csv_to_xml_converter.xml_generator.xml_parsing_utils import (
     get_claim_amount_from_cc08,
@@ -43,3 +44,24 @@ def test_xml_parsing_utils(tmp_path):
     bad_xml = tmp_path / "bad.xml"
     bad_xml.write_text("<bad>", encoding="utf-8")
     assert parse_xml(str(bad_xml)) is None
+
+
+def test_xml_parsing_utils_file_like():
+    """The extraction helpers accept open binary streams, not just paths."""
+    cc08_bytes = (
+        b'<checkupClaim xmlns="https://www.mhlw.go.jp/stf/seisakunitsuite/bunya/0000161103.html">'
+        b'<settlement><claimAmount value="12345.67"/></settlement></checkupClaim>'
+    )
+    gc08_bytes = (
+        b'<gc:GuidanceClaimDocument xmlns:gc="urn:MHLW:guidance:claim:GC:2021">'
+        b'<gc:settlementDetails><gc:claimAmount value="5000"/></gc:settlementDetails>'
+        b"</gc:GuidanceClaimDocument>"
+    )
+    cda_bytes = b'<cda:ClinicalDocument xmlns:cda="urn:hl7-org:v3"></cda:ClinicalDocument>'
+
+    assert get_claim_amount_from_cc08(io.BytesIO(cc08_bytes)) == 12345.67
+    assert get_claim_amount_from_gc08(io.BytesIO(gc08_bytes)) == 5000.0
+    assert get_claim_amount(io.BytesIO(cc08_bytes)) == 12345.67
+    assert get_subject_count_from_cda(io.BytesIO(cda_bytes)) == 1
+    assert get_subject_count_from_cda(io.BytesIO(cc08_bytes)) == 0
+    assert parse_xml(io.BytesIO(b"<bad>")) is None